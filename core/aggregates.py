@@ -0,0 +1,188 @@
+import pandas as pd
+from core.dateindex import DAY_COLUMN, DayIndex, day_numbers
+
+
+# Колонки строк, по которым строятся агрегаты
+SOURCE_COLUMNS = [DAY_COLUMN, "Hour", "DayOfWeek", "TimeOfDay", "Airline_name", "DelayCategory",
+                  "DelayGroup", "IsCancelled", "Total_Passengers", "Total_Cargo"]
+
+# Итоговые распределения -> ряды (День, значение), из сумм которых они получаются
+DAY_TOTALS = {
+    "time_of_day": "time_of_day_by_day",
+    "day_of_week": "day_of_week_by_day",
+    "airline_cancelled": "airline_cancelled_by_day",
+    "airline_delayed": "airline_delayed_by_day",
+}
+
+# Ряды с индексом (День, ...), которые срезаются по дням
+DAY_LEVELS = ("hourly", "delay_groups", *DAY_TOTALS.values())
+
+
+def add_counts(total, part):
+    """Складывает два агрегата (Series или DataFrame) с выравниванием по индексу"""
+    if total is None:
+        return part
+    return total.add(part, fill_value=0)
+
+
+class FlightAggregates:
+    """Дневные и почасовые агрегаты набора данных о рейсах.
+
+    Строятся по частям (update) и не хранят исходных строк, поэтому
+    объем памяти зависит от числа дней и категорий, а не от числа рейсов.
+    Все дневные таблицы индексируются номером дня (см. core.dateindex), а
+    итоговые распределения складываются из рядов по дням, поэтому агрегаты
+    за диапазон дат получаются срезом (between), без пересчета по строкам.
+    """
+
+    def __init__(self):
+        # День -> рейсы, пассажиры, груз, отмены
+        self.daily = None
+        # День -> количество рейсов по категориям задержки
+        self.daily_delays = None
+        # (День, Час) -> пассажиры
+        self.hourly = None
+        # (День, Причина задержки) -> количество рейсов
+        self.delay_groups = None
+        # Распределения рейсов по времени суток и дням недели
+        self.time_of_day = None
+        self.day_of_week = None
+        # Авиакомпания -> количество отмен / задержек
+        self.airline_cancelled = None
+        self.airline_delayed = None
+        # Те же распределения по дням: (День, значение) -> количество рейсов
+        self.time_of_day_by_day = None
+        self.day_of_week_by_day = None
+        self.airline_cancelled_by_day = None
+        self.airline_delayed_by_day = None
+
+        self.rows = 0
+        self.days = None
+        # Ряд с индексом (День, ...) -> номера дней его строк (для срезов по дням)
+        self.level_days = {}
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """Агрегаты по уже загруженному DataFrame"""
+        aggregates = cls()
+        aggregates.update(df)
+        aggregates.finalize()
+        return aggregates
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """Агрегаты по последовательности частей CSV файла"""
+        aggregates = cls()
+        for chunk in chunks:
+            aggregates.update(chunk)
+        aggregates.finalize()
+        return aggregates
+
+    def update(self, chunk):
+        """Добавляет к агрегатам очередную часть строк"""
+        if chunk.empty:
+            return
+
+        if DAY_COLUMN in chunk.columns:
+            day = chunk[DAY_COLUMN]
+        else:
+            day = pd.Series(day_numbers(chunk["Date"]), index=chunk.index, name=DAY_COLUMN)
+
+        daily = pd.DataFrame({
+            "flights": 1,
+            "passengers": chunk["Total_Passengers"],
+            "cargo": chunk["Total_Cargo"],
+            "cancelled": chunk["IsCancelled"].astype(int),
+        }).groupby(day).sum()
+        self.daily = add_counts(self.daily, daily)
+
+        # groupby вместо crosstab: crosstab считает группы по одной в Python
+        daily_delays = chunk.groupby([day, chunk["DelayCategory"].astype(str)]).size().unstack(fill_value=0)
+        self.daily_delays = add_counts(self.daily_delays, daily_delays)
+
+        hourly = chunk.groupby([day, chunk["Hour"]])["Total_Passengers"].sum()
+        self.hourly = add_counts(self.hourly, hourly)
+
+        delay_groups = chunk.groupby([day, chunk["DelayGroup"].astype(str)]).size()
+        self.delay_groups = add_counts(self.delay_groups, delay_groups)
+
+        time_of_day = chunk.groupby([day, chunk["TimeOfDay"].astype(str)]).size()
+        self.time_of_day_by_day = add_counts(self.time_of_day_by_day, time_of_day)
+        day_of_week = chunk.groupby([day, chunk["DayOfWeek"]]).size()
+        self.day_of_week_by_day = add_counts(self.day_of_week_by_day, day_of_week)
+
+        for name, mask in (("airline_cancelled_by_day", chunk["IsCancelled"].astype(bool)),
+                           ("airline_delayed_by_day", chunk["DelayCategory"] != "Нет")):
+            counts = chunk[mask].groupby([day[mask], chunk.loc[mask, "Airline_name"].astype(str)]).size()
+            setattr(self, name, add_counts(getattr(self, name), counts))
+
+        self.rows += len(chunk)
+
+    def finalize(self):
+        """Сортирует индексы и возвращает счетчикам целый тип после сложения частей"""
+        if self.rows == 0:
+            raise ValueError("Файл не содержит данных")
+
+        self.daily = self.daily.sort_index()
+        self.days = DayIndex(self.daily.index.to_numpy())
+        for column in ("flights", "passengers", "cancelled"):
+            self.daily[column] = self.daily[column].astype("int64")
+        self.daily_delays = self.daily_delays.reindex(self.daily.index, fill_value=0).astype("int64")
+
+        for name in DAY_LEVELS:
+            setattr(self, name, getattr(self, name).sort_index().astype("int64"))
+        self.index_levels()
+
+    def index_levels(self):
+        """Номера дней рядов (День, ...) и итоговые распределения по ним"""
+        for name in DAY_LEVELS:
+            self.level_days[name] = DayIndex(getattr(self, name).index.get_level_values(DAY_COLUMN).to_numpy())
+        for total, by_day in DAY_TOTALS.items():
+            series = getattr(self, by_day)
+            setattr(self, total, series.groupby(level=1).sum().astype("int64"))
+
+    def between(self, start, end):
+        """Агрегаты за дни с start по end включительно.
+
+        Дневные таблицы и ряды по дням - срезы позиций (без копирования
+        строк), итоговые распределения складываются из срезов. Для диапазона
+        без данных вызывающий код проверяет days.bounds заранее.
+        """
+        part = FlightAggregates()
+        lo, hi = self.days.bounds(start, end)
+        part.daily = self.daily.iloc[lo:hi]
+        part.daily_delays = self.daily_delays.iloc[lo:hi]
+        part.days = DayIndex(self.days.days[lo:hi])
+        for name in DAY_LEVELS:
+            lo, hi = self.level_days[name].bounds(start, end)
+            setattr(part, name, getattr(self, name).iloc[lo:hi])
+        part.rows = int(part.daily["flights"].sum())
+        part.index_levels()
+        return part
+
+    @property
+    def latest_date(self):
+        """Последний день в данных (datetime.date)"""
+        return self.days.last
+
+    def hourly_on(self, day):
+        """Пассажиропоток по часам за день"""
+        return self.level_on("hourly", day)
+
+    def delay_groups_on(self, day):
+        """Количество рейсов по причинам задержки за день"""
+        return self.level_on("delay_groups", day)
+
+    def level_on(self, name, day):
+        """Часть ряда name с индексом (День, ...) за один день (пустая, если данных нет).
+
+        Ряд отсортирован по дню, поэтому строки дня - срез позиций,
+        найденный бинарным поиском (level_days), без просмотра индекса.
+        """
+        lo, hi = self.level_days[name].day_bounds(day)
+        return getattr(self, name).iloc[lo:hi].droplevel(DAY_COLUMN)
+
+    def top(self, series, n=10):
+        """Первые n значений по убыванию (без нулевых)"""
+        series = series[series > 0]
+        return series.sort_values(ascending=False, kind="stable").head(n)
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+from core.dateindex import day_number
+from core.kpi import KPI_METRICS, LAST_YEAR, PERIODS, delta_array, period_bounds, same_days_last_year
+
+try:
+    import pyarrow  # noqa: F401 - нужен pandas для записи Parquet
+except ImportError:
+    pyarrow = None
+
+
+# Колонки таблицы истории KPI
+HISTORY_COLUMNS = ["Date", "Metric", "Period", "Statistic", "Today", "Reference", "Delta"]
+
+
+def kpi_history(kpi, start=None, end=None):
+    """История карточек KPI за каждый день с данными (длинный формат).
+
+    Строка - сравнение значения метрики за день (Today) с одним показателем
+    периода (Reference) и отклонение в процентах (Delta), как в карточке.
+    Все дни считаются сразу, векторными операциями по дневному кубу.
+    """
+    cube = kpi.cube
+    days = cube.first + np.flatnonzero(cube.has_data)
+    if start is not None:
+        days = days[days >= day_number(start)]
+    if end is not None:
+        days = days[days <= day_number(end)]
+
+    dates = days.astype("datetime64[D]").astype("datetime64[ns]")
+    bounds = period_bounds(days)
+    last_year = same_days_last_year(days)
+
+    parts = []
+    for metric, spec in KPI_METRICS.items():
+        today = cube.value(metric, days)
+        statistics = ["total"] if spec["kind"] == "total" else ["mean", "median"]
+        for period in PERIODS:
+            stats = kpi.period_stats(metric, period, *bounds[period])
+            for statistic in statistics:
+                parts.append(history_part(dates, metric, period, statistic, today, stats[statistic]))
+        parts.append(history_part(dates, metric, LAST_YEAR, "value", today, cube.value(metric, last_year)))
+
+    history = pd.concat(parts, ignore_index=True)
+    for column in ("Metric", "Period", "Statistic"):
+        history[column] = history[column].astype("category")
+    return history.sort_values("Date", kind="stable", ignore_index=True)
+
+
+def history_part(dates, metric, period, statistic, today, reference):
+    """Строки истории для одного показателя одной метрики"""
+    return pd.DataFrame({
+        "Date": dates,
+        "Metric": metric,
+        "Period": period,
+        "Statistic": statistic,
+        "Today": today,
+        "Reference": reference,
+        "Delta": delta_array(today, reference),
+    }, columns=HISTORY_COLUMNS)
+
+
+def export_history(history, file_path):
+    """Сохраняет историю KPI в Parquet или CSV (по расширению файла)"""
+    if str(file_path).lower().endswith(".parquet"):
+        if pyarrow is None:
+            raise RuntimeError("Для сохранения в Parquet нужен пакет pyarrow")
+        history.to_parquet(file_path, index=False)
+    else:
+        history.to_csv(file_path, index=False)
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from core.schema import NO_DELAY_GROUP
+
+
+# Колонки глобального фильтра дашборда: колонка -> подпись
+FILTER_COLUMNS = {
+    "Airline_name": "Авиакомпания",
+    "Airport_arr": "Аэропорт прибытия",
+    "TimeOfDay": "Время суток",
+    "DelayGroup": "Причина задержки",
+}
+
+# Значения, которых нет в списках фильтра (графики причин задержек их не показывают)
+HIDDEN_VALUES = {
+    "DelayGroup": {NO_DELAY_GROUP},
+}
+
+
+class BitmapIndex:
+    """Битовые маски строк для значений категориальных колонок.
+
+    Для каждого значения колонки хранится упакованная маска строк
+    (np.packbits, один бит на строку). Отбор по нескольким колонкам - это
+    OR масок выбранных значений внутри колонки и AND между колонками, без
+    повторного просмотра строковых колонок. Маски колонки строятся при
+    первом обращении к ней.
+    """
+
+    def __init__(self, dataset, columns=FILTER_COLUMNS):
+        self.dataset = dataset
+        self.columns = [column for column in columns if column in dataset.columns]
+        self.rows = len(dataset)
+        # Колонка -> {значение: упакованная маска}
+        self.bitmaps = {}
+
+    def values(self, column):
+        """Значения колонки для фильтра в порядке категорий (без HIDDEN_VALUES)"""
+        series = self.dataset.column(column)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = list(series.cat.categories)
+        else:
+            values = sorted(series.dropna().unique(), key=str)
+        hidden = HIDDEN_VALUES.get(column, ())
+        return [value for value in values if value not in hidden]
+
+    def column_bitmaps(self, column):
+        if column not in self.bitmaps:
+            series = self.dataset.column(column)
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes, values = series.cat.codes.to_numpy(), series.cat.categories
+            else:
+                codes, values = pd.factorize(series)
+            self.bitmaps[column] = {value: np.packbits(codes == code) for code, value in enumerate(values)}
+        return self.bitmaps[column]
+
+    def mask(self, column, values):
+        """Упакованная маска строк с любым из значений values"""
+        bitmaps = self.column_bitmaps(column)
+        result = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+        for value in values:
+            if value in bitmaps:
+                result |= bitmaps[value]
+        return result
+
+    def select(self, selection, start=None, end=None):
+        """Позиции строк, подходящих под фильтр.
+
+        selection - {колонка: значения}, start и end - диапазон дат
+        (включительно, None - без ограничения). Строки набора данных
+        отсортированы по дате, поэтому диапазон дат - это срез позиций.
+        """
+        lo, hi = 0, self.rows
+        if start is not None or end is not None:
+            lo, hi = self.dataset.days.bounds(start or self.dataset.days.first,
+                                              end or self.dataset.days.last)
+
+        packed = None
+        for column, values in selection.items():
+            column_mask = self.mask(column, values)
+            packed = column_mask if packed is None else packed & column_mask
+        if packed is None:
+            return np.arange(lo, hi)
+        return lo + np.flatnonzero(np.unpackbits(packed, count=self.rows)[lo:hi])
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401 - нужен pandas для чтения/записи Parquet
+except ImportError:
+    pyarrow = None
+
+
+# Каталог кэша и ограничение на его размер
+CACHE_DIR = Path.home() / ".cache" / "analyst-exam"
+CACHE_LIMIT_BYTES = 2 * 2 ** 30
+
+# Размер блока при вычислении хэша файла
+HASH_BLOCK_SIZE = 2 ** 20
+
+
+def new_hasher():
+    """Создает объект для вычисления хэша содержимого файла"""
+    return hashlib.blake2b(digest_size=16)
+
+
+def file_fingerprint(file_path, on_progress=None):
+    """Хэш содержимого файла (on_progress получает число прочитанных байт)"""
+    hasher = new_hasher()
+    bytes_read = 0
+    with open(file_path, "rb") as f:
+        while True:
+            block = f.read(HASH_BLOCK_SIZE)
+            if not block:
+                break
+            hasher.update(block)
+            bytes_read += len(block)
+            if on_progress is not None:
+                on_progress(bytes_read)
+    return hasher.hexdigest()
+
+
+class LruDirectory:
+    """Каталог файлов с индексом и вытеснением давно не используемых записей.
+
+    Индекс хранится в памяти и перечитывается, только если файл индекса
+    изменил другой процесс. Чтение записи (get) не переписывает индекс:
+    время использования сохраняется при следующем изменении индекса или
+    при flush.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None
+        self._index_mtime = None
+        # Есть отметки использования, не записанные в файл индекса
+        self._touched = False
+
+    @property
+    def index_path(self):
+        return self.directory / self.INDEX_NAME
+
+    def read_index(self):
+        """Индекс из памяти (с диска, если файл индекса изменился)"""
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._index is None or mtime != self._index_mtime:
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            self._index_mtime = mtime
+            self._touched = False
+        return self._index
+
+    def write_index(self, index):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            self._index = None
+            raise
+        self._index = index
+        self._index_mtime = self.index_path.stat().st_mtime_ns
+        self._touched = False
+
+    def get(self, key):
+        """Возвращает запись индекса и отмечает её как недавно использованную"""
+        with self._lock:
+            index = self.read_index()
+            entry = index.get(key)
+            if entry is None or not (self.directory / entry["file"]).exists():
+                return None
+            entry["last_used"] = time.time()
+            self._touched = True
+            return dict(entry)
+
+    def flush(self):
+        """Записывает отложенные отметки использования (ошибки записи не мешают работе)"""
+        with self._lock:
+            if not self._touched:
+                return
+            try:
+                self.write_index(self._index)
+            except OSError as e:
+                print(f"Не удалось записать индекс кэша: {e}")
+
+    def path_for(self, key, suffix):
+        """Путь к файлу данных записи"""
+        return self.directory / f"{key}{suffix}"
+
+    def put(self, key, file_name, **meta):
+        """Регистрирует записанный файл и вытесняет старые записи сверх лимита"""
+        with self._lock:
+            index = self.read_index()
+            old = index.get(key)
+            if old is not None and old["file"] != file_name:
+                self.remove_file(old["file"])
+
+            index[key] = dict(meta,
+                              file=file_name,
+                              bytes=(self.directory / file_name).stat().st_size,
+                              last_used=time.time())
+            self.evict(index, keep=key)
+            self.write_index(index)
+
+    def discard(self, key):
+        """Удаляет запись и её файл"""
+        with self._lock:
+            index = self.read_index()
+            entry = index.pop(key, None)
+            if entry is not None:
+                self.remove_file(entry["file"])
+                self.write_index(index)
+
+    def discard_where(self, predicate):
+        """Удаляет все записи, для которых predicate(запись) истинно"""
+        with self._lock:
+            index = self.read_index()
+            stale = [key for key, entry in index.items() if predicate(entry)]
+            for key in stale:
+                self.remove_file(index.pop(key)["file"])
+            if stale:
+                self.write_index(index)
+
+    def evict(self, index, keep=None):
+        """Удаляет давно не используемые записи, пока кэш больше лимита"""
+        total = sum(entry["bytes"] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            entry = index.pop(key)
+            self.remove_file(entry["file"])
+            total -= entry["bytes"]
+
+    def remove_file(self, file_name):
+        try:
+            (self.directory / file_name).unlink()
+        except OSError:
+            pass
+
+
+class SidecarCache:
+    """Колоночная копия (Parquet) открытых CSV файлов.
+
+    Запись действительна, пока у исходного файла совпадают размер,
+    время изменения и хэш содержимого.
+    """
+
+    SUFFIX = ".parquet"
+
+    def __init__(self, directory=CACHE_DIR / "tables", max_bytes=CACHE_LIMIT_BYTES):
+        self.storage = LruDirectory(directory, max_bytes)
+
+    @property
+    def enabled(self):
+        return pyarrow is not None
+
+    @staticmethod
+    def key_for(file_path):
+        """Ключ записи по абсолютному пути исходного файла"""
+        path = os.path.abspath(file_path)
+        return hashlib.blake2b(path.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def source_stat(file_path):
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def flush(self):
+        """Записывает на диск отложенные отметки использования записей"""
+        self.storage.flush()
+
+    def lookup(self, file_path, version=None):
+        """Запись кэша для файла, если размер, время изменения и версия схемы не поменялись"""
+        if not self.enabled:
+            return None
+        entry = self.storage.get(self.key_for(file_path))
+        if entry is None:
+            return None
+        size, mtime = self.source_stat(file_path)
+        if entry["size"] != size or entry["mtime"] != mtime or entry.get("version") != version:
+            return None
+        return entry
+
+    def load(self, entry):
+        """Читает закэшированную таблицу"""
+        return pd.read_parquet(self.storage.directory / entry["file"])
+
+    def store(self, file_path, fingerprint, dataframe, stat=None, version=None):
+        """Сохраняет таблицу в кэш (ошибки записи не мешают работе)"""
+        if not self.enabled:
+            return
+        key = self.key_for(file_path)
+        size, mtime = stat if stat is not None else self.source_stat(file_path)
+        target = self.storage.path_for(key, self.SUFFIX)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(".tmp")
+            dataframe.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, target)
+            self.storage.put(key, target.name,
+                             source=os.path.abspath(file_path),
+                             size=size,
+                             mtime=mtime,
+                             hash=fingerprint,
+                             version=version)
+        except Exception as e:
+            print(f"Не удалось записать кэш для {file_path}: {e}")
+            self.storage.discard(key)
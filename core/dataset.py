@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+from core.dateindex import DAY_COLUMN, DayIndex, index_by_day
+
+
+# Производные колонки: вычисляются один раз при первом обращении
+DERIVED_COLUMNS = {
+    "Month": lambda df: df["Date"].dt.month.astype("int8"),
+    "Year": lambda df: df["Date"].dt.year.astype("int16"),
+}
+
+
+class FlightDataset:
+    """Общий набор данных о рейсах только для чтения.
+
+    Фреймы не копируют таблицу, а получают из нее представления. При
+    включенном Copy-on-Write (mode.copy_on_write) представления разделяют
+    буферы NumPy с исходной таблицей, а попытка записи в них копирует
+    только изменяемую колонку и не затрагивает общие данные.
+
+    Строки отсортированы по дате, а колонка DayNumber позволяет получать
+    срезы за день или диапазон дней бинарным поиском (days.bounds).
+
+    Набор может быть частью строк другой таблицы (subset): тогда он хранит
+    только позиции строк, а сами строки копируются при первом обращении
+    к ним и освобождаются release.
+    """
+
+    # Служебные колонки, которые не показываются пользователю
+    SERVICE_COLUMNS = (DAY_COLUMN,)
+
+    def __init__(self, df, rows=None):
+        if rows is None:
+            df = index_by_day(df)
+            self.days = DayIndex(df[DAY_COLUMN].to_numpy())
+        else:
+            self.days = DayIndex(df[DAY_COLUMN].to_numpy()[rows])
+        # Исходная таблица и позиции строк набора в ней (None - вся таблица)
+        self._source = df
+        self._rows = rows
+        self._table = df if rows is None else None
+        self._derived = {}
+
+    @property
+    def _df(self):
+        """Строки набора (для части таблицы копируются при первом обращении)"""
+        if self._table is None:
+            self._table = self._source.iloc[self._rows].reset_index(drop=True)
+        return self._table
+
+    def __len__(self):
+        return len(self.days)
+
+    @property
+    def columns(self):
+        return self._source.columns.drop(list(self.SERVICE_COLUMNS), errors="ignore")
+
+    @property
+    def dtypes(self):
+        return self._source.dtypes[self.columns]
+
+    @property
+    def latest_date(self):
+        """Последний день в данных (datetime.date)"""
+        return self.days.last
+
+    @property
+    def frame(self):
+        """Представление всей таблицы без копирования данных"""
+        return self._df.copy(deep=False)
+
+    def column(self, name):
+        """Колонка таблицы или производная колонка"""
+        if name in self._df.columns:
+            return self._df[name]
+        return self.derived(name)
+
+    def derived(self, name):
+        """Производная колонка (кэшируется после первого вычисления)"""
+        if name not in self._derived:
+            series = DERIVED_COLUMNS[name](self._df)
+            series.name = name
+            self._derived[name] = series
+        return self._derived[name]
+
+    def view(self, columns=None, derived=()):
+        """Представление с выбранными колонками и производными колонками"""
+        columns = self.columns if columns is None else list(columns)
+        parts = [self._df[columns]] + [self.derived(name) for name in derived]
+        return pd.concat(parts, axis=1, copy=False)
+
+    def between(self, start, end, columns=None):
+        """Строки с start по end включительно (срез без копирования)"""
+        if self._table is None:
+            # Строки части таблицы еще не скопированы: берем только строки диапазона
+            return self.period(start, end).view(columns)
+        lo, hi = self.days.bounds(start, end)
+        return self.view(columns).iloc[lo:hi]
+
+    def on_day(self, day, columns=None):
+        """Строки за один день"""
+        return self.between(day, day, columns)
+
+    def period(self, start, end):
+        """Набор данных из строк с start по end включительно (без копирования строк)"""
+        lo, hi = self.days.bounds(start, end)
+        if self._table is None:
+            return FlightDataset(self._source, self._rows[lo:hi])
+        return FlightDataset(self._table.iloc[lo:hi].reset_index(drop=True))
+
+    def subset(self, rows):
+        """Набор данных из строк с позициями rows (порядок по дате сохраняется).
+
+        Строки копируются только при первом обращении к ним.
+        """
+        rows = np.sort(rows)
+        if self._rows is not None:
+            return FlightDataset(self._source, self._rows[rows])
+        return FlightDataset(self._table, rows)
+
+    def take(self, rows, columns):
+        """Колонки columns строк с позициями rows (копия только этих колонок)"""
+        if self._rows is not None and self._table is None:
+            rows = self._rows[rows]
+            return self._source[list(columns)].iloc[rows]
+        return self._df[list(columns)].iloc[rows]
+
+    def release(self):
+        """Освобождает скопированные строки части таблицы (при обращении они копируются снова)"""
+        if self._rows is not None:
+            self._table = None
+            self._derived = {}
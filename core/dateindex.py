@@ -0,0 +1,68 @@
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+
+
+# Номер дня - количество дней с 1970-01-01
+EPOCH = date(1970, 1, 1)
+DAY_COLUMN = "DayNumber"
+
+
+def day_number(value):
+    """Номер дня для date, datetime, Timestamp или строки с датой"""
+    if not isinstance(value, date):
+        value = pd.Timestamp(value)
+    if hasattr(value, "date"):
+        value = value.date()
+    return (value - EPOCH).days
+
+
+def day_numbers(dates):
+    """Номера дней для колонки дат (int32)"""
+    return np.asarray(dates, dtype="datetime64[ns]").astype("datetime64[D]").astype(np.int32)
+
+
+def from_day_number(number):
+    """Дата (datetime.date) по номеру дня"""
+    return EPOCH + timedelta(days=int(number))
+
+
+def index_by_day(df, date_column="Date"):
+    """Сортирует таблицу по дате и добавляет колонку с номером дня"""
+    if DAY_COLUMN not in df.columns:
+        df[DAY_COLUMN] = day_numbers(df[date_column])
+    if not df[DAY_COLUMN].is_monotonic_increasing:
+        df = df.sort_values(DAY_COLUMN, kind="stable", ignore_index=True)
+    return df
+
+
+class DayIndex:
+    """Поиск диапазонов дней в отсортированном массиве номеров дней.
+
+    Диапазон возвращается как пара позиций (lo, hi), поэтому срез
+    данных выполняется за O(log n) и не копирует строки.
+    """
+
+    def __init__(self, days):
+        self.days = np.asarray(days)
+
+    def __len__(self):
+        return len(self.days)
+
+    @property
+    def first(self):
+        return from_day_number(self.days[0])
+
+    @property
+    def last(self):
+        return from_day_number(self.days[-1])
+
+    def bounds(self, start, end):
+        """Позиции строк с start по end включительно"""
+        lo = np.searchsorted(self.days, day_number(start), side="left")
+        hi = np.searchsorted(self.days, day_number(end), side="right")
+        return int(lo), int(max(lo, hi))
+
+    def day_bounds(self, day):
+        """Позиции строк за один день"""
+        return self.bounds(day, day)
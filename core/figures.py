@@ -0,0 +1,882 @@
+from textwrap import wrap
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib import ticker
+from matplotlib.gridspec import GridSpec
+from matplotlib.patches import Rectangle
+import numpy as np
+import seaborn as sns
+from core.metrics import (day_of_week_counts, time_of_day_counts,
+                          top_cancelled_airlines, top_delayed_airlines)
+
+
+# Построение графиков дашборда без Tkinter: функции возвращают фигуры
+# matplotlib, которые фреймы встраивают в окно, а report.py сохраняет в PNG.
+# Фигуры создаются без pyplot и не попадают в его глобальный список
+
+# Стили для карточек KPI
+KPI_STYLE = {
+    "figsize": (10, 6),
+    "title_fontsize": 12,
+    "title_Y": 0.07,
+    "title_X": 0.97,
+    "title_weight": "bold",
+    "title_ha": "right",
+    "kpi_fontsize": 16,
+    "kpi_weight": "normal",
+    "kpi_1": 0.02,
+    "kpi_2": 1.09,
+    "kpi_pad": 10,
+    "kpi_ha": "left",
+    "kpi_va": "top",
+    "table_fontsize": 14,
+    "header_fontsize": 14,
+    "bbox_table": [0.27, 0.12, 0.73, 0.7],
+    "scale_table": (1, 2),
+    "cell_height": 0.15
+}
+
+# Оформление карточек KPI: подпись ({value} - значение за день) и цвета.
+# delta_colors - цвета отклонений (меньше нуля, не меньше нуля)
+KPI_CARDS = {
+    "flights": {
+        "headline": "КОЛИЧЕСТВО РЕЙСОВ\nЗА ДЕНЬ: {value}",
+        "facecolor": '#fef6e6', "kpi_color": '#2a7fff', "kpi_alpha": 0.2,
+        "header_color": '#f8f9fa', "delta_colors": ('#ff6b6b', '#51cf66'),
+    },
+    "passengers": {
+        "headline": "КОЛ-ВО ПАССАЖИРОВ\nЗА ДЕНЬ: {value}",
+        "facecolor": '#eefaf9', "kpi_color": '#00b894', "kpi_alpha": 0.2,
+        "header_color": '#f8f9fa', "delta_colors": ('#ff7675', '#55efc4'),
+    },
+    "cargo_per_flight": {
+        "headline": "СРЕДНИЙ ВЕС\nНА РЕЙС: {value} кг",
+        "facecolor": '#fffaf3', "kpi_color": '#fdcb6e', "kpi_alpha": 0.25,
+        "header_color": '#f8f9fa', "delta_colors": ('#fab1a0', '#81ecec'),
+    },
+    "Нет": {
+        "headline": "КОЛ-ВО РЕЙСОВ\nБЕЗ ЗАДЕРЖЕК: {value}",
+        "facecolor": '#f3fcf1', "kpi_color": '#4dd599', "kpi_alpha": 0.2,
+        "header_color": '#e8faf1', "delta_colors": ('#ff6b6b', '#51cf66'),
+    },
+    "Малая": {
+        "headline": "КОЛ-ВО РЕЙСОВ\nС МАЛОЙ ЗАДЕРЖКОЙ: {value}",
+        "facecolor": '#fff8f2', "kpi_color": '#ffc078', "kpi_alpha": 0.2,
+        "header_color": '#fff3e0', "delta_colors": ('#51cf66', '#ff6b6b'),
+    },
+    "Средняя": {
+        "headline": "КОЛ-ВО РЕЙСОВ\nС СРЕДНЕЙ ЗАДЕРЖКОЙ (15-60 мин.): {value}",
+        "facecolor": '#fff4fa', "kpi_color": '#e599f7', "kpi_alpha": 0.2,
+        "header_color": '#fdefff', "delta_colors": ('#51cf66', '#ff6b6b'),
+    },
+    "Высокая": {
+        "headline": "КОЛ-ВО РЕЙСОВ\nС ВЫСОКОЙ ЗАДЕРЖКОЙ (60-180 мин.): {value}",
+        "facecolor": '#fff2f2', "kpi_color": '#ff8787', "kpi_alpha": 0.2,
+        "header_color": '#ffe8e8', "delta_colors": ('#51cf66', '#ff6b6b'),
+    },
+    "Критическая": {
+        "headline": "КОЛ-ВО РЕЙСОВ\nС КРИТИЧЕСКОЙ ЗАДЕРЖКОЙ (180+ мин.): {value}",
+        "facecolor": '#fff0f0', "kpi_color": '#fa5252', "kpi_alpha": 0.2,
+        "header_color": '#ffe3e3', "delta_colors": ('#51cf66', '#ff6b6b'),
+    },
+    "cancelled": {
+        "headline": "КОЛ-ВО ОТМЕНЁННЫХ РЕЙСОВ: {value}",
+        "facecolor": '#fff0f0', "kpi_color": '#fa5252', "kpi_alpha": 0.2,
+        "header_color": '#ffe3e3', "delta_colors": ('#51cf66', '#ff6b6b'),
+    },
+}
+
+# Оформление графика самых загруженных направлений
+TOP_ROUTES_STYLE = {
+    "bg_color": "#2E3440",
+    "bar_color": "#88C0D0",
+    "highlight_color": "#BF616A",
+    "text_color": "#E5E9F0",
+    "grid_color": "#4C566A",
+    "title_font": {"family": "sans-serif", "weight": "bold", "size": 14},
+    "label_font": {"family": "sans-serif", "size": 12},
+    "tick_font": {"family": "sans-serif", "size": 10},
+    "annotation_font": {"family": "sans-serif", "size": 9, "weight": "bold"},
+    "palette": "mako"
+}
+
+# Графики вкладки "Статистика Рейсы": данные, заголовок, подписи осей и ориентация
+FLIGHT_CHARTS = {
+    "time_of_day": (time_of_day_counts, "Распределение рейсов по времени суток",
+                    "Время суток", "Количество рейсов", "v"),
+    "day_of_week": (day_of_week_counts, "Распределение рейсов по дням недели",
+                    "День недели (0=Пн, 6=Вс)", "Количество рейсов", "v"),
+    "airline_cancelled": (top_cancelled_airlines, "Топ-10 авиакомпаний по отменам",
+                          "Количество отмен", "Авиакомпания", "h"),
+    "airline_delayed": (top_delayed_airlines, "Топ-10 авиакомпаний по задержкам",
+                        "Количество задержек", "Авиакомпания", "h"),
+}
+
+MONTH_NAMES = ['Янв', 'Фев', 'Мар', 'Апр', 'Май', 'Июн',
+               'Июл', 'Авг', 'Сен', 'Окт', 'Ноя', 'Дек']
+WEEKDAY_NAMES = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
+
+
+def format_delta(delta):
+    return f"{'+' if delta > 0 else ''}{delta}%"
+
+
+def kpi_table_text(card):
+    """Заголовки и текст ячеек таблицы карточки KPI"""
+    last_year = card["last_year"]
+    rows = [period["name"] for period in card["periods"]] + [last_year["name"]]
+
+    if card["kind"] == "total":
+        columns = ['Кол-во за период', 'Δ от периода']
+        cell_text = [[f"{int(period['total'])}", format_delta(period["delta"])]
+                     for period in card["periods"]]
+        cell_text.append([f"{int(last_year['value'])}", format_delta(last_year["delta"])])
+        return rows, columns, cell_text
+
+    columns = ['Среднее', 'Медиана', 'Δ от ср.', 'Δ от мед.']
+    cell_text = [[f"{int(period['mean'])}", f"{int(period['median'])}",
+                  format_delta(period["delta_mean"]), format_delta(period["delta_median"])]
+                 for period in card["periods"]]
+    cell_text.append([f"{int(last_year['value'])}", "-", format_delta(last_year["delta"]), "-"])
+    return rows, columns, cell_text
+
+
+def kpi_cell_colors(card, cell_text, delta_colors):
+    """Белые ячейки значений и цветные ячейки отклонений"""
+    value_columns = 1 if card["kind"] == "total" else 2
+    colors = []
+    for row in cell_text:
+        row_colors = ['white'] * value_columns
+        for delta_text in row[value_columns:]:
+            if delta_text == "-":
+                row_colors.append('white')
+            else:
+                delta_value = float(delta_text.replace('%', '').replace('+', ''))
+                row_colors.append(delta_colors[0] if delta_value < 0 else delta_colors[1])
+        colors.append(row_colors)
+    return colors
+
+
+def kpi_card_figure(card, style=KPI_STYLE):
+    """Карточка KPI: значение за день и таблица сравнения с периодами"""
+    look = KPI_CARDS[card["metric"]]
+
+    fig = Figure(figsize=style["figsize"], facecolor=look["facecolor"])
+    ax = fig.subplots()
+    fig.suptitle(f"ДАТА: {card['date'].strftime('%d.%m.%Y')}",
+                 fontsize=style["title_fontsize"],
+                 x=style["title_X"],  # позиция по X
+                 y=style["title_Y"],
+                 weight=style["title_weight"],
+                 ha=style["title_ha"]  # выравнивание
+                 )
+
+    # Основной KPI
+    ax.text(style["kpi_1"],
+            style["kpi_2"],
+            look["headline"].format(value=int(card["today"])),
+            fontsize=style["kpi_fontsize"],
+            ha=style["kpi_ha"],
+            va=style["kpi_va"],
+            weight=style["kpi_weight"],
+            bbox=dict(facecolor=look["kpi_color"],
+                      alpha=look["kpi_alpha"],
+                      pad=style["kpi_pad"]))
+
+    # Таблица сравнения с периодами
+    rows, columns, cell_text = kpi_table_text(card)
+    table = ax.table(cellText=cell_text,
+                     rowLabels=rows,
+                     colLabels=columns,
+                     rowColours=[look["header_color"]] * len(rows),
+                     colColours=[look["header_color"]] * len(columns),
+                     cellColours=kpi_cell_colors(card, cell_text, look["delta_colors"]),
+                     cellLoc='center',
+                     loc='center',
+                     bbox=style["bbox_table"])
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(style["table_fontsize"])
+    table.scale(*style["scale_table"])
+
+    for (row, col), cell in table.get_celld().items():
+        if row == 0:
+            cell.set_text_props(weight='bold', fontsize=style["header_fontsize"])
+        cell.set_edgecolor('#dee2e6')
+        cell.set_height(style["cell_height"])
+
+    ax.axis('off')
+    fig.tight_layout()
+    return fig
+
+
+def hourly_profile_figure(profile):
+    """Пассажиропоток по часам за день с нормальным диапазоном"""
+    hourly = profile["hourly"]
+    mean_val, median_val = profile["mean"], profile["median"]
+    lower_bound, upper_bound = profile["lower"], profile["upper"]
+
+    # Настройка стиля
+    sns.set_theme(style="whitegrid")
+    plt.rcParams['font.family'] = 'Arial'
+
+    # Создание фигуры с динамическим размером
+    fig = Figure(figsize=(8, 4), facecolor='none', dpi=100)  # Уменьшенный размер
+    ax = fig.subplots()
+    ax.set_facecolor('#f8f9fa')
+    fig.patch.set_alpha(0)
+
+    # Зеленый коридор (нормальный диапазон)
+    ax.axhspan(lower_bound, upper_bound, facecolor='#a7c4bc', alpha=0.3,
+               label=f'Нормальный диапазон ({lower_bound:,.0f}-{upper_bound:,.0f})')
+
+    # Средняя линия
+    ax.axhline(mean_val, color='#2a9d8f', linestyle='--', linewidth=2,
+               alpha=0.7, label=f'Среднее: {mean_val:,.0f}')
+
+    # Медиана
+    ax.axhline(median_val, color='#e76f51', linestyle=':', linewidth=2,
+               alpha=0.7, label=f'Медиана: {median_val:,.0f}')
+
+    # Основной график
+    sns.lineplot(
+        data=hourly,
+        x="Hour",
+        y="Total_Passengers",
+        marker="o",
+        markersize=8,
+        markeredgecolor='white',
+        markerfacecolor='#e63946',
+        linewidth=3,
+        ax=ax,
+        color='#457b9d',
+        label='Пассажиропоток'
+    )
+
+    # Метки данных с цветом в зависимости от положения относительно коридора
+    for x, y in zip(hourly["Hour"], hourly["Total_Passengers"]):
+        color = '#1d3557' if lower_bound <= y <= upper_bound else '#e63946'
+        ax.text(
+            x, y + 0.05 * y, f'{y:,.0f}',
+            color=color,
+            fontsize=8,  # Уменьшенный размер шрифта
+            fontweight='bold',
+            ha='center',
+            va='bottom'
+        )
+
+    # Подсветка точек вне коридора
+    outliers = hourly[~hourly["Total_Passengers"].between(lower_bound, upper_bound)]
+    if not outliers.empty:
+        ax.scatter(
+            outliers["Hour"],
+            outliers["Total_Passengers"],
+            s=100,  # Уменьшенный размер точек
+            facecolors='none',
+            edgecolors='#e63946',
+            linewidths=2,
+            label='Отклонения от нормы'
+        )
+
+    # Настройка заголовка
+    ax.set_title(
+        f"АНАЛИЗ ПАССАЖИРОПОТОКА С СТАТИСТИКОЙ\n{profile['day'].strftime('%d.%m.%Y')}",
+        fontsize=12,  # Уменьшенный размер шрифта
+        fontweight='bold',
+        color='#1d3557',
+        pad=15  # Уменьшенный отступ
+    )
+
+    # Подписи осей
+    ax.set_xlabel("Час дня", fontsize=10, fontweight='bold', color='#1d3557', labelpad=8)
+    ax.set_ylabel("Количество пассажиров", fontsize=10, fontweight='bold', color='#1d3557', labelpad=8)
+
+    # Настройка осей
+    ax.tick_params(axis='both', which='major', labelsize=8, colors='#1d3557')
+    ax.set_xticks(np.arange(0, 24, 1))
+    ax.set_xlim(-0.5, 23.5)
+
+    # Форматирование чисел
+    ax.get_yaxis().set_major_formatter(plt.FuncFormatter(lambda x, loc: "{:,}".format(int(x))))
+
+    # Сетка
+    ax.grid(True, linestyle='--', alpha=0.7, color='#adb5bd')
+
+    # Границы
+    for spine in ['top', 'right']:
+        ax.spines[spine].set_visible(False)
+    for spine in ['bottom', 'left']:
+        ax.spines[spine].set_color('#495057')
+
+    # Легенда (выносим за пределы графика справа)
+    ax.legend(
+        loc='center left',
+        frameon=True,
+        framealpha=0.9,
+        facecolor='white',
+        edgecolor='#495057',
+        fontsize=8,  # Уменьшенный размер шрифта
+        bbox_to_anchor=(1.05, 0.5),
+        borderaxespad=0.5
+    )
+
+    # Настройка расположения элементов
+    fig.tight_layout()  # Автоматическая подгонка элементов
+    return fig
+
+
+def delay_reasons_figure(delay_counts, day, facecolor):
+    """Круговая диаграмма причин задержек за день"""
+    # Создаем фигуру с динамическим размером, основанным на размере фрейма
+    fig = Figure(facecolor=facecolor)
+
+    # Изменяем компоновку: добавляем 2 подграфика - узкий для заголовка и основной для диаграммы
+    gs = fig.add_gridspec(1, 2, width_ratios=[0.1, 0.9])
+    ax_title = fig.add_subplot(gs[0])
+    ax = fig.add_subplot(gs[1])
+
+    # Скрываем оси для заголовка
+    ax_title.axis('off')
+
+    # Добавляем вертикальный заголовок слева
+    title_text = f"АНАЛИЗ ПРИЧИН ЗАДЕРЖЕК\n{day.strftime('%d.%m.%Y')}"
+    ax_title.text(
+        0.5, 0.5,
+        title_text,
+        rotation=90,
+        va='center',
+        ha='center',
+        fontsize=14,
+        fontweight='bold',
+        multialignment='center'
+    )
+
+    # Автоматическая подстройка отступов
+    fig.subplots_adjust(left=0.15, right=0.7, top=0.9, bottom=0.15)
+
+    # Без задержанных рейсов круговую диаграмму построить нельзя (все доли нулевые)
+    if delay_counts.empty:
+        ax.axis('off')
+        ax.text(0.5, 0.5, "Нет задержек", ha='center', va='center', fontsize=14, fontweight='bold',
+                color='#6c757d', transform=ax.transAxes)
+        return fig
+
+    # Генерация красивых цветов
+    colors = sns.color_palette("husl", len(delay_counts))
+
+    # Рисуем красивую круговую диаграмму (убраны labels)
+    wedges, texts, autotexts = ax.pie(
+        delay_counts,
+        labels=None,
+        autopct=lambda p: f'{p:.1f}%\n({int(p / 100 * sum(delay_counts))})',
+        startangle=140,
+        colors=colors,
+        wedgeprops={
+            'linewidth': 1,
+            'edgecolor': 'white'
+        },
+        textprops={'fontsize': 9, 'fontweight': 'bold'},
+        pctdistance=0.85
+    )
+
+    # Настройка внешнего вида процентов
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(10)
+        autotext.set_fontweight('bold')
+
+    # Добавляем белую рамку вокруг каждого сегмента
+    for wedge in wedges:
+        wedge.set_edgecolor('white')
+        wedge.set_linewidth(1.5)
+
+    # Обертка длинных меток для легенды
+    wrapped_labels = ["\n".join(wrap(label, 20)) for label in delay_counts.index]
+
+    # Добавляем легенду справа
+    legend = ax.legend(
+        wedges,
+        wrapped_labels,
+        title="Причины",
+        loc="center left",
+        bbox_to_anchor=(1, 0.5),
+        fontsize=9,
+        title_fontsize=11,
+        facecolor='#f5f5f5'
+    )
+    legend.get_title().set_fontweight('bold')
+
+    # Делаем диаграмму равномерной
+    ax.axis('equal')
+
+    # Добавляем подпись внизу
+    fig.text(
+        0.5, 0.02,
+        "Данные по задержкам рейсов",
+        ha='center',
+        fontsize=10,
+        fontweight='bold'
+    )
+    return fig
+
+
+def figure_scale(fig):
+    """Масштаб шрифтов и отступов относительно фигуры 6x4 дюйма"""
+    fig_width, fig_height = fig.get_size_inches()
+    return min(fig_width / 6, fig_height / 4)
+
+
+def style_top_routes_axes(ax, day, style, scale):
+    """Оформление осей графика самых загруженных направлений"""
+    ax.set_facecolor(style["bg_color"])
+    ax.grid(True, color=style["grid_color"], linestyle='--', alpha=0.7)
+
+    for spine in ax.spines.values():
+        spine.set_edgecolor(style["grid_color"])
+
+    # Set titles and labels
+    ax.set_title(
+        f"ТОП-10 САМЫХ ЗАГРУЖЕННЫХ НАПРАВЛЕНИЙ\n{day.strftime('%d %B %Y').upper()}",
+        fontdict={
+            "family": "sans-serif",
+            "weight": "bold",
+            "size": max(6, 12 * scale),  # Scaled font
+            "color": style["text_color"]
+        },
+        pad=20 * scale
+    )
+
+    ax.set_xlabel(
+        "ОБЩЕЕ КОЛИЧЕСТВО ПАССАЖИРОВ",
+        fontdict={
+            "family": "sans-serif",
+            "size": max(6, 10 * scale),
+            "color": style["text_color"]
+        },
+        labelpad=10 * scale
+    )
+
+    ax.set_ylabel(
+        "АЭРОПОРТ НАЗНАЧЕНИЯ",
+        fontdict={
+            "family": "sans-serif",
+            "size": max(6, 10 * scale),
+            "color": style["text_color"]
+        },
+        labelpad=10 * scale
+    )
+
+    ax.tick_params(
+        axis='both',
+        colors=style["text_color"],
+        labelsize=max(6, 8 * scale)
+    )
+    ax.xaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
+
+
+def top_routes_artists(ax, routes, style, scale):
+    """Столбцы и подписи значений для всех направлений (один раз на график).
+
+    Показ и подписи задает update_top_routes, поэтому анимация только
+    меняет уже созданные объекты.
+    """
+    bars = ax.barh(routes.index, routes.values, color=style["bar_color"], height=0.7)
+    labels = [
+        ax.text(
+            0,
+            bar.get_y() + bar.get_height() / 2,
+            "",
+            ha='left',
+            va='center',
+            fontdict={
+                "family": "sans-serif",
+                "size": max(6, 8 * scale),
+                "weight": "bold",
+                "color": style["text_color"]
+            }
+        )
+        for bar in bars
+    ]
+    return bars, labels
+
+
+def update_top_routes(bars, labels, routes, count, style):
+    """Показывает первые count направлений; последнее показанное выделено"""
+    offset = max(routes.values) * 0.02
+    for i, (bar, label, value) in enumerate(zip(bars, labels, routes.values)):
+        shown = i < count
+        bar.set_visible(shown)
+        label.set_visible(shown)
+        bar.set_width(value if shown else 0)
+        if count > 1 and i == count - 1:
+            # Highlight the top bar
+            bar.set_color(style["highlight_color"])
+        else:
+            bar.set_facecolor(style["bar_color"])
+            bar.set_edgecolor("none")
+        if shown:
+            label.set_x(value + offset)
+            label.set_text(f'{value:,.0f}')
+
+
+def draw_top_routes(ax, routes, count, style, scale):
+    """Столбцы первых count направлений с подписями значений"""
+    bars, labels = top_routes_artists(ax, routes.iloc[:count], style, scale)
+    update_top_routes(bars, labels, routes.iloc[:count], count, style)
+    return bars
+
+
+def top_routes_figure(routes, day, style=TOP_ROUTES_STYLE):
+    """Самые загруженные направления за день (все столбцы сразу, без анимации)"""
+    fig = Figure(figsize=(6, 4), facecolor=style["bg_color"])
+    ax = fig.subplots()
+    # Поля как у фрейма после первой подгонки под размер окна
+    fig.subplots_adjust(left=0.3, right=0.85, top=0.8, bottom=0.15)
+    style_top_routes_axes(ax, day, style, figure_scale(fig))
+    if len(routes):
+        draw_top_routes(ax, routes, len(routes), style, figure_scale(fig))
+    return fig
+
+
+def apply_common_style(ax, title, xlabel="", ylabel=""):
+    ax.set_title(title, fontsize=14, weight='bold', pad=15)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.tick_params(axis='x', labelsize=10)
+    ax.tick_params(axis='y', labelsize=10)
+    sns.despine(ax=ax)
+    plt.setp(ax.get_xticklabels(), rotation=30, ha="right")
+
+
+def add_value_labels(ax, orient="v"):
+    """Добавляет подписи к столбцам"""
+    for container in ax.containers:
+        if orient == "v":
+            ax.bar_label(container, fmt='%d', label_type='edge', padding=3, fontsize=9)
+        else:
+            ax.bar_label(container, fmt='%d', label_type='edge', padding=3, fontsize=9)
+
+
+def bar_at(ax, event, categories):
+    """Категория столбца под курсором события мыши (None - щелчок мимо столбцов).
+
+    categories - категории в порядке столбцов графика.
+    """
+    for patch, category in zip(ax.patches, categories):
+        if patch.contains(event)[0]:
+            return category
+    return None
+
+
+def outline_bar(ax, categories, category, color="#2E3440"):
+    """Обводит столбец категории category (None - снимает обводку).
+
+    Рамка - отдельный объект поверх столбца, оформление столбцов не меняется.
+    """
+    for patch in [patch for patch in ax.patches if patch.get_gid() == "selection"]:
+        patch.remove()
+    for patch, name in zip(ax.patches, categories):
+        if name == category:
+            ax.add_patch(Rectangle(patch.get_xy(), patch.get_width(), patch.get_height(), fill=False,
+                                   edgecolor=color, linewidth=2, gid="selection"))
+
+
+def flight_chart_figure(name, aggregates):
+    """Столбчатая диаграмма вкладки "Статистика Рейсы" (см. FLIGHT_CHARTS)"""
+    counts_for, title, xlabel, ylabel, orient = FLIGHT_CHARTS[name]
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    sns.set_theme(style="whitegrid")
+    counts = counts_for(aggregates)
+    if orient == "v":
+        sns.barplot(x=counts.index, y=counts.values, palette="pastel", ax=ax)
+    else:
+        sns.barplot(y=counts.index, x=counts.values, palette="pastel", ax=ax)
+    apply_common_style(ax, title, xlabel, ylabel)
+    add_value_labels(ax, orient=orient)
+    fig.tight_layout()
+    return fig
+
+
+def monthly_passengers_figure(grouped, years, highlight_year):
+    """Сравнение пассажиропотока по месяцам, выбранный год выделен.
+
+    Линия каждого года строится один раз, смена выделенного года только
+    меняет оформление линий (highlight_monthly_year).
+    """
+    # Создаем фигуру с увеличенным размером
+    plt.style.use('seaborn-v0_8')  # Используем актуальный стиль
+    fig = Figure(figsize=(12, 7), dpi=100)
+    ax = fig.subplots()
+    fig.patch.set_facecolor('#f5f5f5')
+    ax.set_facecolor('#f9f9f9')
+
+    # Месяца для оси X
+    months = range(1, 13)
+
+    # Рисуем линии для каждого года
+    for year in years:
+        year_data = grouped[grouped["Year"] == year]
+        # Убедимся, что данные есть для всех месяцев
+        complete_data = year_data.set_index("Month").reindex(months).reset_index()
+        sns.lineplot(
+            data=complete_data,
+            x="Month",
+            y="Total_Passengers",
+            label=str(year),
+            marker='o',
+            ax=ax
+        )
+
+    # Настройки графика
+    ax.set_title(
+        "Сравнение пассажиропотока по месяцам",
+        fontsize=16,
+        fontweight='bold',
+        pad=20
+    )
+    ax.set_xlabel(
+        "Месяц",
+        fontsize=13,
+        fontweight='bold',
+        labelpad=10
+    )
+    ax.set_ylabel(
+        "Количество пассажиров",
+        fontsize=13,
+        fontweight='bold',
+        labelpad=10
+    )
+
+    # Увеличиваем размер шрифта меток на осях
+    ax.tick_params(axis='both', which='major', labelsize=11)
+
+    # Устанавливаем метки месяцев на оси X
+    ax.set_xticks(months)
+    ax.set_xticklabels(MONTH_NAMES, fontsize=11)
+
+    # Добавляем сетку для лучшей читаемости
+    ax.grid(True, linestyle='--', alpha=0.6)
+
+    # Улучшаем отображение больших чисел на оси Y
+    ax.get_yaxis().set_major_formatter(
+        plt.FuncFormatter(lambda x, p: format(int(x), ','))
+    )
+
+    # Оптимизируем легенду
+    ax.legend(
+        title='Год',
+        bbox_to_anchor=(1.02, 1),
+        loc='upper left',
+        fontsize=11,
+        title_fontsize=12,
+        framealpha=0.9
+    )
+
+    highlight_monthly_year(fig, years, highlight_year)
+    fig.tight_layout()
+    return fig
+
+
+def highlight_monthly_year(fig, years, highlight_year):
+    """Выделяет год на графике monthly_passengers_figure, не перестраивая его"""
+    ax = fig.axes[0]
+    legend = ax.get_legend()
+    lines = {line.get_label(): line for line in ax.get_lines()}
+    handles = dict(zip([text.get_text() for text in legend.get_texts()], legend.legend_handles))
+
+    # Цветовая палитра для невыделенных лет
+    palette = sns.color_palette("husl", len(years))
+
+    for i, year in enumerate(years):
+        if year == highlight_year:
+            # Выделенный год - толстая линия с маркерами и подписями
+            style = dict(linewidth=3.5, alpha=1, markersize=10, markerfacecolor='white',
+                         markeredgewidth=2, color='#e63946', zorder=3)
+        else:
+            # Остальные годы - тонкие линии
+            style = dict(linewidth=1.5, alpha=0.7, markersize=5, markerfacecolor=palette[i],
+                         markeredgewidth=0.75, color=palette[i], zorder=2)
+        lines[str(year)].set(markeredgecolor='white', **style)
+        style.pop("zorder")
+        handles[str(year)].set(markeredgecolor='white', **style)
+
+    # Выделяем текущий выбранный год в легенде (остальные - цветом заголовка)
+    for text in legend.get_texts():
+        selected = text.get_text() == str(highlight_year)
+        text.set_fontweight('bold' if selected else 'normal')
+        text.set_color('#e63946' if selected else legend.get_title().get_color())
+
+    # Подписи данных для выделенного года
+    for text in [text for text in ax.texts if text.get_gid() == "highlight"]:
+        text.remove()
+    offset = ax.get_ylim()[1] * 0.02
+    for month, value in zip(*lines[str(highlight_year)].get_data()):
+        if not np.isnan(value):
+            ax.text(
+                month,
+                value + offset,
+                f"{int(value / 1000)}K" if value >= 1000 else str(int(value)),
+                ha='center',
+                va='bottom',
+                fontsize=10,
+                fontweight='bold',
+                color='#e63946',
+                gid="highlight"
+            )
+
+
+def weekly_profile_figure(profile):
+    """Тепловая карта пассажиропотока по дням недели и часам и среднее по часам"""
+    mean_line = profile["mean_line"]
+    median_value, mean_value, std_dev = profile["median"], profile["mean"], profile["std"]
+    lower_bound, upper_bound = profile["lower"], profile["upper"]
+
+    # Создание фигуры с двумя subplots
+    fig = Figure(figsize=(10, 8), dpi=100)
+    gs = GridSpec(2, 1, height_ratios=[3, 1.5])  # Явно задаем высоту нижнего графика
+
+    # Первый subplot - тепловая карта
+    ax1 = fig.add_subplot(gs[0])
+
+    # Настройка цветовой палитры
+    cmap = sns.color_palette("YlOrRd", as_cmap=True)
+
+    # Создание тепловой карты с аннотацией
+    sns.heatmap(
+        profile["heat"],
+        cmap=cmap,
+        ax=ax1,
+        annot=True,
+        fmt=".0f",
+        annot_kws={"size": 8},
+        linewidths=0.5,
+        linecolor="white",
+        cbar_kws={'shrink': 0.8, 'label': 'Кол-во пассажиров'}
+    )
+
+    # Улучшение заголовка и подписей
+    ax1.set_title(
+        f"Средний пассажиропоток по дням и часам (данные за {profile['years_range']} годы)",
+        fontsize=14,
+        pad=20,
+        fontweight="bold"
+    )
+
+    # Улучшение подписей осей
+    ax1.set_xlabel(
+        "Час",
+        fontsize=12,
+        labelpad=10,
+        fontweight="bold"
+    )
+    ax1.set_ylabel(
+        "День недели",
+        fontsize=12,
+        labelpad=10,
+        fontweight="bold"
+    )
+
+    # Улучшение подписей тиков
+    ax1.set_yticklabels(
+        WEEKDAY_NAMES,
+        rotation=0,
+        fontsize=10
+    )
+    ax1.set_xticklabels(
+        [f"{int(h)}:00" for h in ax1.get_xticks()],
+        rotation=45,
+        fontsize=9
+    )
+
+    # Второй subplot - линейный график среднего значения по всем дням недели
+    ax2 = fig.add_subplot(gs[1], sharex=ax1)  # sharex для совпадения осей X
+
+    # Ярко-зеленая полоса допустимых значений
+    ax2.axhspan(lower_bound, upper_bound, facecolor='#00FF00', alpha=0.3, label='Допустимый диапазон')
+
+    # Линии медианы и среднего
+    ax2.axhline(median_value, color='red', linestyle='--', linewidth=1.5, label='Медиана')
+    ax2.axhline(mean_value, color='purple', linestyle='-.', linewidth=1.5, label='Среднее')
+
+    # Построение средней линии с маркировкой аномалий
+    for hour, value in mean_line.items():
+        if value < lower_bound or value > upper_bound:
+            # Аномальные значения отмечаем красным
+            ax2.plot(hour, value, 'ro', markersize=6)
+            ax2.text(
+                hour, value, f'{int(value)}',
+                ha='center', va='bottom',
+                fontsize=8, color='red',
+                bbox=dict(facecolor='white', alpha=0.7, edgecolor='red', boxstyle='round,pad=0.2')
+            )
+        else:
+            # Нормальные значения отмечаем синим
+            ax2.plot(hour, value, 'bo', markersize=4)
+            ax2.text(
+                hour, value, f'{int(value)}',
+                ha='center', va='bottom',
+                fontsize=8,
+                bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2')
+            )
+
+    # Соединяем точки линией
+    ax2.plot(mean_line.index, mean_line, color='blue', linewidth=1, alpha=0.5)
+
+    # Настройка осей и подписей
+    ax2.set_title(
+        "Средний пассажиропоток по часам (усредненный по всем дням недели)",
+        fontsize=12,
+        pad=10,
+        fontweight="bold"
+    )
+    ax2.set_xlabel("Час", fontsize=10)
+    ax2.set_ylabel("Пассажиры", fontsize=10)
+    ax2.grid(True, linestyle='--', alpha=0.7)
+
+    # Установка целочисленных значений на оси X (часы)
+    ax2.set_xticks(np.arange(0, 24))
+    ax2.set_xticklabels([f"{h}:00" for h in range(24)], rotation=45)
+
+    # Выравнивание ширины графиков
+    plt.setp(ax1.get_xticklabels(), visible=False)  # Скрыть метки часов на верхнем графике
+
+    # Создаем пространство справа для легенды и статистики
+    fig.subplots_adjust(right=0.75)
+
+    # Выносим легенду в отдельную область справа
+    ax2.legend(
+        loc='center left',
+        bbox_to_anchor=(1.05, 0.5),
+        frameon=True,
+        framealpha=1.0,
+        edgecolor='black'
+    )
+
+    # Выносим статистику в отдельную область справа под легендой
+    stats_text = (
+        f"Статистика:\n\n"
+        f"Медиана: {median_value:.0f}\n"
+        f"Среднее: {mean_value:.0f}\n"
+        f"Стандартное отклонение: {std_dev:.0f}\n"
+        f"Допустимый диапазон:\n"
+        f"[{lower_bound:.0f}, {upper_bound:.0f}]"
+    )
+
+    ax2.text(
+        1.05, 0.25, stats_text,
+        transform=ax2.transAxes,
+        verticalalignment='top',
+        bbox=dict(
+            boxstyle='round',
+            facecolor='white',
+            alpha=0.8,
+            edgecolor='gray'
+        ),
+        fontsize=10
+    )
+
+    # Оптимизация расположения элементов
+    fig.subplots_adjust(hspace=0.3)  # Регулировка вертикального расстояния между графиками
+    fig.tight_layout(rect=[0, 0, 0.85, 1])  # Оставляем 15% пространства справа
+    return fig
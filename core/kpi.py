@@ -0,0 +1,246 @@
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from core.dateindex import day_number
+from core.quantiles import QuantileService
+from core.schema import DELAY_CATEGORIES
+
+
+# Строки карточки KPI
+PERIODS = ["Неделя", "Месяц", "Квартал", "Год"]
+LAST_YEAR = "Прошлый год"
+
+# Метрики карточек: колонка дневного куба и способ сравнения с периодами
+#   mean  - среднее за календарный день периода и медиана по дням
+#   ratio - отношение двух колонок (среднее и медиана дневных отношений)
+#   total - сумма за период
+KPI_METRICS = {
+    "flights": {"kind": "mean", "column": "flights"},
+    "passengers": {"kind": "mean", "column": "passengers"},
+    "cargo_per_flight": {"kind": "ratio", "column": "cargo", "per": "flights"},
+    "cancelled": {"kind": "total", "column": "cancelled"},
+}
+# Категории задержки: медиана только по дням, в которые были такие рейсы
+KPI_METRICS.update({category: {"kind": "mean", "column": category, "skip_zero": True}
+                    for category in DELAY_CATEGORIES})
+
+
+def calc_delta(current, reference):
+    """Отклонение от опорного значения в процентах (0, если опорное значение 0)"""
+    if reference == 0:
+        return 0
+    return round(float((current - reference) / reference * 100), 1)
+
+
+def same_day_last_year(day):
+    """Тот же день год назад (29 февраля -> 28 февраля)"""
+    try:
+        return day.replace(year=day.year - 1)
+    except ValueError:
+        return day.replace(year=day.year - 1, day=28)
+
+
+def period_ranges(day):
+    """Периоды сравнения для дня: прошлая календарная неделя и начало
+    месяца/квартала/года по вчерашний день (название, начало, конец)"""
+    day_before = day - timedelta(days=1)
+    week_start = day - timedelta(days=day.weekday() + 7)
+    month_start = date(day.year, day.month, 1)
+    quarter_start = date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    year_start = date(day.year, 1, 1)
+    return [
+        ("Неделя", week_start, week_start + timedelta(days=6)),
+        ("Месяц", month_start, day_before),
+        ("Квартал", quarter_start, day_before),
+        ("Год", year_start, day_before),
+    ]
+
+
+def period_bounds(days):
+    """Векторный вариант period_ranges для массива номеров дней:
+    {название периода: (номера первых дней, номера последних дней)}"""
+    days = np.asarray(days, dtype="int64")
+    day_before = days - 1
+    # 1970-01-01 - четверг, weekday: понедельник = 0
+    week_start = days - (days + 3) % 7 - 7
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+    return {
+        "Неделя": (week_start, week_start + 6),
+        "Месяц": (month_start_days(months), day_before),
+        "Квартал": (month_start_days(months - months % 3), day_before),
+        "Год": (month_start_days(months - months % 12), day_before),
+    }
+
+
+def month_start_days(months):
+    """Номер первого дня месяца по номеру месяца с 1970-01"""
+    return months.astype("datetime64[M]").astype("datetime64[D]").astype("int64")
+
+
+def same_days_last_year(days):
+    """Векторный вариант same_day_last_year для массива номеров дней"""
+    days = np.asarray(days, dtype="int64")
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+    day_of_month = days - month_start_days(months)
+    last_year = month_start_days(months - 12)
+    month_length = month_start_days(months - 11) - last_year
+    return last_year + np.minimum(day_of_month, month_length - 1)
+
+
+def delta_array(current, reference):
+    """Векторный вариант calc_delta"""
+    current, reference = np.asarray(current, dtype="float64"), np.asarray(reference, dtype="float64")
+    safe = np.where(reference == 0, 1, reference)
+    return np.where(reference == 0, 0, np.round((current - safe) / safe * 100, 1))
+
+
+class DailyCube:
+    """Дневной куб метрик на непрерывном календаре с накопленными суммами.
+
+    Дни без данных заполнены нулями и отмечены в маске has_data. Сумма
+    метрики за любой диапазон дней - разность двух накопленных сумм, поэтому
+    не зависит от длины диапазона. Дни задаются номерами (см. core.dateindex),
+    методы принимают как отдельные номера, так и массивы номеров.
+    """
+
+    def __init__(self, frame):
+        days = frame.index.to_numpy(dtype="int64")
+        self.first = int(days[0])
+        self.length = int(days[-1]) - self.first + 1
+        positions = days - self.first
+
+        self.has_data = np.zeros(self.length, dtype=bool)
+        self.has_data[positions] = True
+        self.data_prefix = self.cumulative(self.has_data)
+
+        self.values = {}
+        self.prefix = {}
+        for column in frame.columns:
+            dense = np.zeros(self.length, dtype="float64")
+            dense[positions] = frame[column].to_numpy(dtype="float64")
+            self.values[column] = dense
+            self.prefix[column] = self.cumulative(dense)
+
+    @staticmethod
+    def cumulative(values):
+        """Накопленные суммы с нулем в начале: prefix[i] - сумма первых i дней"""
+        return np.concatenate(([0], np.cumsum(values)))
+
+    def span(self, start, end):
+        """Позиции [lo, hi) диапазона дней с start по end включительно"""
+        lo = np.clip(np.asarray(start) - self.first, 0, self.length)
+        hi = np.clip(np.asarray(end) - self.first + 1, 0, self.length)
+        return lo, np.maximum(lo, hi)
+
+    def total(self, column, start, end):
+        """Сумма метрики за диапазон дней"""
+        lo, hi = self.span(start, end)
+        prefix = self.prefix[column]
+        return prefix[hi] - prefix[lo]
+
+    def data_days(self, start, end):
+        """Количество дней с данными в диапазоне"""
+        lo, hi = self.span(start, end)
+        return self.data_prefix[hi] - self.data_prefix[lo]
+
+    def value(self, column, day):
+        """Значение метрики за день (0 вне календаря куба)"""
+        position = np.asarray(day) - self.first
+        inside = (position >= 0) & (position < self.length)
+        return np.where(inside, self.values[column][np.clip(position, 0, self.length - 1)], 0)
+
+
+class KpiEngine:
+    """Карточки KPI "день против периода" по дневному кубу метрик.
+
+    Куб (день x рейсы, пассажиры, груз на рейс, категории задержки, отмены)
+    собирается один раз из дневных агрегатов. Суммы и средние за периоды
+    берутся из накопленных сумм куба, медианы - из QuantileService, поэтому
+    карточку за любой день можно посчитать без обращения к строкам исходной
+    таблицы.
+    """
+
+    def __init__(self, aggregates):
+        self.first_date = aggregates.days.first
+        self.latest_date = aggregates.latest_date
+
+        delays = aggregates.daily_delays.reindex(columns=DELAY_CATEGORIES, fill_value=0)
+        daily = pd.concat([aggregates.daily, delays], axis=1).astype("float64")
+
+        # Колонка куба на каждую метрику (для отношений - уже поделенная)
+        metrics = pd.DataFrame({metric: self.metric_values(daily, spec)
+                                for metric, spec in KPI_METRICS.items()}, index=daily.index)
+        self.cube = DailyCube(metrics)
+        self.medians = QuantileService(self.cube,
+                                       skip_zero=[metric for metric, spec in KPI_METRICS.items()
+                                                  if spec.get("skip_zero")])
+
+    @staticmethod
+    def metric_values(daily, spec):
+        values = daily[spec["column"]].to_numpy()
+        if spec["kind"] == "ratio":
+            per = daily[spec["per"]].to_numpy()
+            values = np.divide(values, per, out=np.zeros_like(values), where=per > 0)
+        return values
+
+    def cards(self, day=None):
+        """Все карточки KPI за день (по умолчанию - последний день в данных)"""
+        return {metric: self.card(metric, day) for metric in KPI_METRICS}
+
+    def card(self, metric, day=None):
+        """Карточка KPI: значение за день, периоды сравнения и прошлый год"""
+        spec = KPI_METRICS[metric]
+        day = day or self.latest_date
+        today = float(self.cube.value(metric, day_number(day)))
+
+        periods = [self.summarize(metric, spec, name, day_number(start), day_number(end), today)
+                   for name, start, end in period_ranges(day)]
+
+        last_year = float(self.cube.value(metric, day_number(same_day_last_year(day))))
+        return {
+            "metric": metric,
+            "kind": spec["kind"],
+            "date": day,
+            "today": today,
+            "periods": periods,
+            "last_year": {"name": LAST_YEAR, "value": last_year, "delta": calc_delta(today, last_year)},
+        }
+
+    def period_stats(self, metric, period, start, end, medians=True):
+        """Сумма, среднее и медиана метрики за период с дня start по день end.
+
+        Дни задаются номерами или массивами номеров, для метрик-сумм
+        среднее и медиана не считаются.
+        """
+        spec = KPI_METRICS[metric]
+        total = self.cube.total(metric, start, end)
+        if spec["kind"] == "total":
+            return {"total": total}
+
+        if spec["kind"] == "ratio":
+            # Среднее дневных отношений по дням с данными
+            length = self.cube.data_days(start, end)
+        else:
+            # Среднее за календарный день периода
+            length = np.maximum(np.asarray(end) - start + 1, 0)
+        stats = {"total": total, "mean": np.where(length > 0, total / np.maximum(length, 1), 0)}
+        if medians:
+            stats["median"] = self.medians.quantiles(metric, period, start, end)
+        return stats
+
+    def summarize(self, metric, spec, name, start, end, today):
+        """Показатели метрики за период с дня start по день end (номера дней)"""
+        stats = self.period_stats(metric, name, start, end, medians=False)
+        if spec["kind"] == "total":
+            total = float(stats["total"])
+            return {"name": name, "total": total, "delta": calc_delta(today, total)}
+
+        mean = float(stats["mean"])
+        median = self.medians.median(metric, name, start, end)
+        return {
+            "name": name,
+            "mean": mean,
+            "median": median,
+            "delta_mean": calc_delta(today, mean),
+            "delta_median": calc_delta(today, median),
+        }
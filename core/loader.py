@@ -0,0 +1,193 @@
+import os
+import queue
+import threading
+import pandas as pd
+from core.aggregates import FlightAggregates
+from core.cache import SidecarCache, file_fingerprint, new_hasher
+from core.dataset import FlightDataset
+from core.dateindex import index_by_day
+from core.schema import SCHEMA_VERSION, apply_schema, memory_report, memory_usage
+
+
+# Количество строк, читаемых за один шаг
+CHUNK_ROWS = 100_000
+
+
+class LoadCancelled(Exception):
+    """Загрузка прервана пользователем"""
+
+
+class ProgressReader:
+    """Обёртка над файлом, считающая прочитанные байты"""
+
+    def __init__(self, raw, hasher=None):
+        self.raw = raw
+        self.hasher = hasher
+        self.bytes_read = 0
+
+    def consume(self, data):
+        self.bytes_read += len(data)
+        if self.hasher is not None:
+            self.hasher.update(data)
+        return data
+
+    def read(self, size=-1):
+        return self.consume(self.raw.read(size))
+
+    def readline(self, size=-1):
+        return self.consume(self.raw.readline(size))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+
+class CsvLoader(threading.Thread):
+    """Фоновое чтение CSV файла по частям с отчётом о прогрессе.
+
+    Результат и прогресс передаются через очередь events в виде кортежей:
+    ("stage", text), ("progress", (bytes_read, rows)),
+    ("done", (dataset, aggregates)), ("cancelled", None) или ("error", exception).
+
+    Если передан cache, неизменившийся файл читается из колоночной копии,
+    а после разбора CSV копия создается заново.
+
+    В потоковом режиме (streaming=True) строки не сохраняются: каждая часть
+    сразу сворачивается в FlightAggregates, а вместо набора данных передается None.
+    """
+
+    def __init__(self, file_path, chunk_rows=CHUNK_ROWS, cache=None, streaming=False):
+        super().__init__(daemon=True)
+        self.file_path = file_path
+        self.chunk_rows = chunk_rows
+        self.cache = cache
+        self.streaming = streaming
+        self.total_bytes = os.path.getsize(file_path)
+        self.events = queue.Queue()
+        self._cancel_event = threading.Event()
+
+        # Хэш содержимого файла и признак чтения из кэша (известны после загрузки)
+        self.fingerprint = None
+        self.from_cache = False
+
+    def cancel(self):
+        """Запрашивает остановку загрузки"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            result = self.load_with_aggregates()
+        except LoadCancelled:
+            self.events.put(("cancelled", None))
+        except Exception as e:
+            self.events.put(("error", e))
+        else:
+            self.events.put(("done", result))
+
+    def check_cancelled(self):
+        """Прерывает загрузку, если пользователь нажал «Отмена»"""
+        if self.cancelled:
+            raise LoadCancelled()
+
+    def report(self, bytes_read, rows):
+        self.events.put(("progress", (bytes_read, rows)))
+
+    def stage(self, text):
+        self.events.put(("stage", text))
+
+    def iter_chunks(self, hasher=None):
+        """Читает CSV по частям, сообщая о прочитанных байтах и строках"""
+        rows = 0
+        with open(self.file_path, "rb") as raw:
+            reader = ProgressReader(raw, hasher)
+            for chunk in pd.read_csv(reader, parse_dates=["Date"], chunksize=self.chunk_rows):
+                self.check_cancelled()
+                rows += len(chunk)
+                self.report(reader.bytes_read, rows)
+                yield chunk
+
+    def load_cached(self):
+        """Читает файл из кэша, если его содержимое не изменилось"""
+        entry = self.cache.lookup(self.file_path, SCHEMA_VERSION)
+        if entry is None:
+            return None
+
+        self.stage("Проверка кэша")
+
+        def on_progress(bytes_read):
+            self.check_cancelled()
+            self.report(bytes_read, 0)
+
+        fingerprint = file_fingerprint(self.file_path, on_progress)
+        if fingerprint != entry["hash"]:
+            return None
+
+        self.stage("Чтение из кэша")
+        dataframe = self.cache.load(entry)
+        self.fingerprint = fingerprint
+        self.from_cache = True
+        self.report(self.total_bytes, len(dataframe))
+        return dataframe
+
+    def load_aggregates(self):
+        """Сворачивает файл в дневные агрегаты, не удерживая исходные строки"""
+        self.stage("Потоковая агрегация")
+        hasher = new_hasher()
+        aggregates = FlightAggregates.from_chunks(apply_schema(chunk) for chunk in self.iter_chunks(hasher))
+        self.check_cancelled()
+        self.fingerprint = hasher.hexdigest()
+        return aggregates
+
+    def load_with_aggregates(self):
+        """Загружает файл и строит по нему дневные агрегаты"""
+        if self.streaming:
+            return None, self.load_aggregates()
+
+        dataframe = self.load()
+        self.stage("Построение агрегатов")
+        aggregates = FlightAggregates.from_dataframe(dataframe)
+        self.check_cancelled()
+        return FlightDataset(dataframe), aggregates
+
+    def load(self):
+        """Загружает весь файл в один DataFrame"""
+        stat = SidecarCache.source_stat(self.file_path)
+
+        if self.cache is not None and self.cache.enabled:
+            dataframe = self.load_cached()
+            if dataframe is not None:
+                return dataframe
+
+        self.stage("Чтение CSV")
+        hasher = new_hasher()
+        chunks = list(self.iter_chunks(hasher))
+        self.check_cancelled()
+        dataframe = pd.concat(chunks, ignore_index=True)
+        del chunks
+        # Файл только с заголовком: ни отчета о памяти, ни записи в кэш
+        if dataframe.empty:
+            raise ValueError("Файл не содержит данных")
+        self.fingerprint = hasher.hexdigest()
+
+        # Приводим колонки к компактным типам
+        self.stage("Приведение типов")
+        before = memory_usage(dataframe)
+        dataframe = apply_schema(dataframe)
+        memory_report(before, memory_usage(dataframe))
+
+        # Сортируем по дате и добавляем номер дня для быстрых срезов
+        dataframe = index_by_day(dataframe)
+
+        if self.cache is not None:
+            self.stage("Запись кэша")
+            self.cache.store(self.file_path, self.fingerprint, dataframe, stat, SCHEMA_VERSION)
+        return dataframe
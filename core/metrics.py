@@ -0,0 +1,87 @@
+from core.schema import NO_DELAY_GROUP, TIME_OF_DAY
+
+
+def hourly_profile(aggregates, day=None):
+    """Пассажиропоток по часам за день и "зеленый коридор" вокруг среднего"""
+    day = day or aggregates.latest_date
+    hourly = aggregates.hourly_on(day).rename("Total_Passengers").reset_index()
+
+    mean_val = hourly["Total_Passengers"].mean()
+    median_val = hourly["Total_Passengers"].median()
+    std_dev = hourly["Total_Passengers"].std()
+    return {
+        "day": day,
+        "hourly": hourly,
+        "mean": mean_val,
+        "median": median_val,
+        "std": std_dev,
+        # Нормальный диапазон (можно настроить коэффициент)
+        "lower": mean_val - 0.5 * std_dev,
+        "upper": mean_val + 0.5 * std_dev,
+    }
+
+
+def delay_reasons(aggregates, day=None):
+    """Количество задержанных рейсов по причинам за день (без нулевых и "Не указана")"""
+    day = day or aggregates.latest_date
+    delay_counts = aggregates.delay_groups_on(day).drop(NO_DELAY_GROUP, errors="ignore")
+    return delay_counts[delay_counts > 0].sort_values(ascending=False, kind="stable")
+
+
+def top_routes(dataset, day=None, n=10):
+    """Самые загруженные направления за день по числу пассажиров"""
+    day = day or dataset.latest_date
+    day_df = dataset.on_day(day, ["Airport_arr", "Total_Passengers"])
+    routes = day_df.groupby("Airport_arr", observed=True)["Total_Passengers"].sum()
+    return routes.sort_values(ascending=False).head(n)
+
+
+def time_of_day_counts(aggregates):
+    """Количество рейсов по времени суток в естественном порядке"""
+    return aggregates.time_of_day.reindex(TIME_OF_DAY, fill_value=0)
+
+
+def day_of_week_counts(aggregates):
+    """Количество рейсов по дням недели"""
+    return aggregates.day_of_week.sort_index()
+
+
+def top_cancelled_airlines(aggregates, n=10):
+    return aggregates.top(aggregates.airline_cancelled, n)
+
+
+def top_delayed_airlines(aggregates, n=10):
+    return aggregates.top(aggregates.airline_delayed, n)
+
+
+def monthly_passengers(dataset):
+    """Пассажиропоток по годам и месяцам (колонки Year, Month, Total_Passengers)"""
+    df_plot = dataset.view(["Year", "Total_Passengers"], derived=["Month"])
+    return df_plot.groupby(["Year", "Month"])["Total_Passengers"].sum().reset_index()
+
+
+def weekly_profile(dataset):
+    """Средний пассажиропоток по дням недели и часам и его среднее по часам"""
+    df = dataset.view(["DayOfWeek", "Hour", "Total_Passengers"])
+    years = dataset.derived("Year")
+
+    # Тепловая карта: день недели x час (все дни и часы, даже если в части строк их нет)
+    heat_data = df.groupby(["DayOfWeek", "Hour"])["Total_Passengers"].mean().unstack()
+    heat_data = heat_data.reindex(index=range(7), columns=range(24))
+
+    # Среднее по всем дням недели
+    line_data = df.groupby(["Hour", "DayOfWeek"])["Total_Passengers"].mean().unstack()
+    mean_line = line_data.mean(axis=1)
+
+    median_value = mean_line.median()
+    std_dev = mean_line.std()
+    return {
+        "years_range": f"{years.min()}-{years.max()}",
+        "heat": heat_data,
+        "mean_line": mean_line,
+        "median": median_value,
+        "mean": mean_line.mean(),
+        "std": std_dev,
+        "lower": median_value - 0.5 * std_dev,
+        "upper": median_value + 0.5 * std_dev,
+    }
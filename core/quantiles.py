@@ -0,0 +1,104 @@
+from bisect import insort
+import numpy as np
+
+
+def calendar_buckets(days, period):
+    """Номер календарного периода (неделя, месяц, квартал, год) для номеров дней"""
+    days = np.asarray(days, dtype="int64")
+    if period == "Неделя":
+        # 1970-01-01 - четверг, недели начинаются с понедельника
+        return (days + 3) // 7
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+    if period == "Месяц":
+        return months
+    if period == "Квартал":
+        return months // 3
+    if period == "Год":
+        return months // 12
+    raise ValueError(f"Неизвестный период: {period}")
+
+
+def sorted_quantile(values, q):
+    """Квантиль отсортированного списка (линейная интерполяция, как в numpy)"""
+    position = q * (len(values) - 1)
+    lo = int(position)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (position - lo)
+
+
+def running_quantiles(values, include, buckets, q=0.5):
+    """Квантиль с начала периода по каждый день включительно.
+
+    Значения каждого периода накапливаются в отсортированном списке,
+    поэтому весь календарь обрабатывается за один проход. Дни, в которых
+    еще нет ни одного значения, получают NaN.
+    """
+    result = np.full(len(values), np.nan)
+    window = []
+    for i in range(len(values)):
+        if i == 0 or buckets[i] != buckets[i - 1]:
+            window = []
+        if include[i]:
+            insort(window, values[i])
+        if window:
+            result[i] = sorted_quantile(window, q)
+    return result
+
+
+class QuantileService:
+    """Медианы и квантили метрик дневного куба за периоды сравнения KPI.
+
+    Для каждой пары (метрика, период) один раз считается квантиль с начала
+    календарного периода по каждый день. Период "с начала месяца по вчера"
+    и "прошлая неделя" заканчиваются одним днем, поэтому ответ для любой
+    даты - одно чтение из массива. Ответы кэшируются по (метрика, период,
+    день, квантиль).
+    """
+
+    def __init__(self, cube, skip_zero=()):
+        self.cube = cube
+        # Метрики, для которых учитываются только дни с ненулевым значением
+        self.skip_zero = set(skip_zero)
+        self._days = cube.first + np.arange(cube.length)
+        self._buckets = {}
+        self._running = {}
+        self._results = {}
+
+    def buckets(self, period):
+        if period not in self._buckets:
+            self._buckets[period] = calendar_buckets(self._days, period)
+        return self._buckets[period]
+
+    def running(self, metric, period, q):
+        """Квантили с начала периода по каждый день календаря куба"""
+        key = (metric, period, q)
+        if key not in self._running:
+            values = self.cube.values[metric]
+            include = self.cube.has_data
+            if metric in self.skip_zero:
+                include = include & (values > 0)
+            self._running[key] = running_quantiles(values, include, self.buckets(period), q)
+        return self._running[key]
+
+    def quantile(self, metric, period, start, end, q=0.5):
+        """Квантиль метрики за период с дня start по день end (номера дней).
+
+        Период должен начинаться с начала календарного периода period, для
+        дней без данных возвращается 0.
+        """
+        key = (metric, period, start, end, q)
+        if key not in self._results:
+            self._results[key] = float(self.quantiles(metric, period, start, end, q))
+        return self._results[key]
+
+    def quantiles(self, metric, period, start, end, q=0.5):
+        """Векторный вариант quantile для массивов номеров дней (без кэша)"""
+        start, end = np.asarray(start), np.asarray(end)
+        position = np.minimum(end, self.cube.first + self.cube.length - 1) - self.cube.first
+        clipped = np.clip(position, 0, self.cube.length - 1)
+        valid = (position >= 0) & (self._days[clipped] >= start)
+        values = self.running(metric, period, q)[clipped]
+        return np.where(valid & ~np.isnan(values), values, 0)
+
+    def median(self, metric, period, start, end):
+        return self.quantile(metric, period, start, end, 0.5)
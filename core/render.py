@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+import numpy as np
+
+
+# Число процессов для отрисовки (один процессор остается окну)
+RENDER_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def init_worker():
+    """Настройка процесса отрисовки: только Agg, без окон"""
+    matplotlib.use("Agg")
+    # Импорт заранее, чтобы первая карточка не ждала загрузки модулей
+    import core.figures  # noqa: F401
+
+
+def render_figure(build, args, size):
+    """Строит фигуру build(*args) и растеризует её в RGBA размером size (пиксели).
+
+    Возвращает (ширина, высота, байты RGBA). Фигура меняет размер после
+    построения, как при встраивании в окно через FigureCanvasTkAgg.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = build(*args)
+    width, height = size
+    fig.set_size_inches(width / fig.dpi, height / fig.dpi, forward=False)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    pixels = np.asarray(canvas.buffer_rgba())
+    return pixels.shape[1], pixels.shape[0], pixels.tobytes()
+
+
+class FigureRenderer:
+    """Пул процессов, рисующих фигуры matplotlib в растровые изображения (Agg).
+
+    Окно только показывает готовые изображения, поэтому отрисовка не
+    блокирует Tk, а несколько карточек рисуются параллельно на разных ядрах.
+    Процессы запускаются через spawn: они не наследуют Tk и потоки загрузки.
+    """
+
+    def __init__(self, workers=RENDER_WORKERS):
+        self.executor = ProcessPoolExecutor(max_workers=workers,
+                                            mp_context=multiprocessing.get_context("spawn"),
+                                            initializer=init_worker)
+
+    def submit(self, build, args, size):
+        """Ставит фигуру в очередь; результат - Future с (ширина, высота, RGBA)"""
+        return self.executor.submit(render_figure, build, args, size)
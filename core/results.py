@@ -0,0 +1,213 @@
+import functools
+import hashlib
+import os
+import pickle
+import types
+from core.cache import CACHE_DIR, LruDirectory
+from core.schema import SCHEMA_VERSION
+
+
+# Ограничение на размер кэша результатов
+RESULTS_LIMIT_BYTES = 256 * 2 ** 20
+
+# Версия формата результатов (увеличить, если расчет меняется вне кода функции)
+RESULTS_VERSION = 1
+
+# Типы глобальных констант, которые входят в определение расчета
+DEFINITION_TYPES = (dict, list, tuple, set, frozenset, str, int, float, bool)
+
+# Пакеты проекта: их функции и классы входят в определение расчета
+PROJECT_PACKAGES = ("core",)
+
+
+def code_digest(code, hasher):
+    """Добавляет в хэш байт-код функции, включая вложенные функции"""
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            code_digest(const, hasher)
+        elif isinstance(const, frozenset):
+            # Порядок элементов множества зависит от хэширования строк в процессе
+            hasher.update(repr(sorted(map(repr, const))).encode("utf-8"))
+        else:
+            hasher.update(repr(const).encode("utf-8"))
+
+
+def code_names(code):
+    """Глобальные имена и атрибуты, которые использует код (включая вложенные функции)"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= code_names(const)
+    return names
+
+
+def is_project(value):
+    return getattr(value, "__module__", "").split(".")[0] in PROJECT_PACKAGES
+
+
+def add_definition(value, hasher, seen):
+    """Добавляет в хэш функцию или класс проекта и все, что они используют по имени"""
+    if id(value) in seen:
+        return
+    seen.add(id(value))
+    hasher.update(f"{value.__module__}.{value.__qualname__}".encode("utf-8"))
+
+    if isinstance(value, type):
+        for name, member in sorted(vars(value).items()):
+            member = member.fget if isinstance(member, property) else getattr(member, "__func__", member)
+            if isinstance(member, types.FunctionType):
+                add_definition(member, hasher, seen)
+        return
+
+    code_digest(value.__code__, hasher)
+    for name in sorted(code_names(value.__code__)):
+        if name in value.__globals__:
+            hasher.update(name.encode("utf-8"))
+            add_value(value.__globals__[name], hasher, seen)
+
+
+def add_value(value, hasher, seen):
+    """Добавляет в хэш константу модуля; функции и классы проекта - по их коду"""
+    if isinstance(value, (types.FunctionType, type)):
+        if is_project(value):
+            add_definition(value, hasher, seen)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            hasher.update(repr(key).encode("utf-8"))
+            add_value(item, hasher, seen)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            add_value(item, hasher, seen)
+    elif isinstance(value, (set, frozenset)):
+        hasher.update(repr(sorted(map(repr, value))).encode("utf-8"))
+    elif isinstance(value, DEFINITION_TYPES):
+        hasher.update(repr(value).encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def definition_digest(func, *classes):
+    """Хэш определения расчета.
+
+    В хэш входит код функции и, рекурсивно, код функций и классов пакета
+    core, которые она использует по имени (вспомогательные функции, классы
+    вроде DailyCube), а также константы их модулей (KPI_METRICS). Для метода
+    учитывается весь его класс, classes - классы данных, методы которых
+    вызывает расчет (например, FlightDataset). Изменение любой из них дает
+    новый ключ, поэтому результаты старой версии расчета из кэша не читаются.
+    Изменения вне проекта (pandas, формат результатов) отмечаются
+    увеличением RESULTS_VERSION.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{func.__module__}.{func.__qualname__}:{RESULTS_VERSION}:{SCHEMA_VERSION}".encode("utf-8"))
+    seen = set()
+    add_definition(func, hasher, seen)
+    owner = func.__globals__.get(func.__qualname__.split(".")[0])
+    for value in (owner, *classes):
+        if isinstance(value, type) and is_project(value):
+            add_definition(value, hasher, seen)
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """Результаты расчетов дашборда на диске.
+
+    Кэшируются только расчеты по всем строкам файла (профиль колонок,
+    помесячный и недельный пассажиропоток): карточки KPI и показатели за
+    день считаются по агрегатам быстрее, чем читаются с диска.
+
+    Ключ записи - хэш содержимого файла, определение расчета и его аргументы
+    (в том числе день, за который он сделан). Записи одного файла помечены
+    его путем: при открытии измененного файла старые результаты удаляются,
+    остальные вытесняются по давности использования.
+    """
+
+    SUFFIX = ".pkl"
+
+    def __init__(self, directory=CACHE_DIR / "results", max_bytes=RESULTS_LIMIT_BYTES):
+        self.storage = LruDirectory(directory, max_bytes)
+
+    @staticmethod
+    def key_for(fingerprint, definition, params):
+        text = f"{fingerprint}:{definition}:{params}"
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def bind(self, file_path, fingerprint):
+        """Результаты для открытого файла; записи прежней версии файла удаляются"""
+        source = os.path.abspath(file_path)
+        self.storage.discard_where(lambda entry: entry.get("source") == source and entry.get("hash") != fingerprint)
+        return DatasetResults(self, source, fingerprint)
+
+    def load(self, key, fingerprint):
+        """Читает результат (None, если записи нет или она повреждена)"""
+        entry = self.storage.get(key)
+        if entry is None or entry.get("hash") != fingerprint:
+            return None
+        try:
+            with open(self.storage.directory / entry["file"], "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            self.storage.discard(key)
+            return None
+
+    def flush(self):
+        """Записывает на диск отложенные отметки использования записей"""
+        self.storage.flush()
+
+    def store(self, key, value, source, fingerprint):
+        """Сохраняет результат (ошибки записи не мешают работе)"""
+        target = self.storage.path_for(key, self.SUFFIX)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, target)
+            self.storage.put(key, target.name, source=source, hash=fingerprint)
+        except Exception as e:
+            print(f"Не удалось записать результат в кэш: {e}")
+            self.storage.discard(key)
+
+
+class DatasetResults:
+    """Результаты расчетов для одного открытого файла.
+
+    Без кэша или без хэша файла (например, пустой файл) расчет просто
+    выполняется каждый раз. scope отличает результаты по части строк файла
+    (например, после глобального фильтра) и входит в ключ записи.
+    """
+
+    def __init__(self, cache=None, source=None, fingerprint=None, scope=None):
+        self.cache = cache
+        self.source = source
+        self.fingerprint = fingerprint
+        self.scope = scope
+
+    def scoped(self, scope):
+        """Результаты для части строк того же файла (scope=None - весь файл)"""
+        return DatasetResults(self.cache, self.source, self.fingerprint, scope)
+
+    @property
+    def enabled(self):
+        return self.cache is not None and self.fingerprint is not None
+
+    def get(self, func, data, *args, **kwargs):
+        """Результат func(data, *args, **kwargs) из кэша или с расчетом.
+
+        data - данные открытого файла (набор данных или агрегаты), они
+        определяются хэшем файла, в ключ входит только код их класса.
+        Остальные аргументы должны однозначно задаваться своим repr.
+        """
+        if not self.enabled:
+            return func(data, *args, **kwargs)
+
+        params = repr((args, sorted(kwargs.items())))
+        if self.scope is not None:
+            params = f"{self.scope}:{params}"
+        key = self.cache.key_for(self.fingerprint, definition_digest(func, type(data)), params)
+        value = self.cache.load(key, self.fingerprint)
+        if value is None:
+            value = func(data, *args, **kwargs)
+            self.cache.store(key, value, self.source, self.fingerprint)
+        return value
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+
+
+# Версия схемы (увеличивается при изменении типов, чтобы сбросить кэш)
+SCHEMA_VERSION = 2
+
+# Известные значения категориальных колонок в нужном порядке
+TIME_OF_DAY = ["Ночь", "Утро", "День", "Вечер"]
+DELAY_CATEGORIES = ["Нет", "Малая", "Средняя", "Высокая", "Критическая"]
+# Причина задержки у рейсов без задержки
+NO_DELAY_GROUP = "Не указана"
+
+# Объявленная схема набора данных о рейсах
+FLIGHT_SCHEMA = {
+    "Date": "datetime64[ns]",
+    "Hour": "int8",
+    "DayOfWeek": "int8",
+    "Year": "int16",
+    "TimeOfDay": TIME_OF_DAY,
+    "DelayCategory": DELAY_CATEGORIES,
+    "DelayGroup": "category",
+    "Airline_name": "category",
+    "Airport_arr": "category",
+    "IsCancelled": "bool",
+    "Total_Passengers": "int32",
+    "Total_Cargo": "float32",
+}
+
+# Строковые представления логических значений
+BOOL_VALUES = {"true": True, "false": False, "1": True, "0": False, "да": True, "нет": False}
+
+
+def to_category(series, known=None):
+    """Категориальный тип: известные значения в заданном порядке, остальные в конце"""
+    if known is None:
+        return series.astype("category")
+    extra = sorted(set(series.dropna().unique()) - set(known), key=str)
+    return series.astype(pd.CategoricalDtype(list(known) + extra, ordered=True))
+
+
+def to_bool(series):
+    """Логический тип из bool, чисел или строк вида True/False"""
+    if series.dtype == bool:
+        return series
+    if pd.api.types.is_numeric_dtype(series):
+        return series.fillna(0).astype(bool)
+    return series.astype(str).str.strip().str.lower().map(BOOL_VALUES).fillna(False).astype(bool)
+
+
+def to_integer(series, dtype):
+    """Целочисленный тип (при пропусках остается float32)"""
+    series = pd.to_numeric(series, errors="coerce")
+    if series.isna().any():
+        return series.astype("float32")
+    return series.astype(dtype)
+
+
+def apply_schema(df, schema=FLIGHT_SCHEMA):
+    """Приводит колонки DataFrame к объявленной схеме (неизвестные колонки не меняются)"""
+    for column, dtype in schema.items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+
+        if isinstance(dtype, list):
+            df[column] = to_category(series, dtype)
+        elif dtype == "category":
+            df[column] = to_category(series)
+        elif dtype == "bool":
+            df[column] = to_bool(series)
+        elif dtype.startswith("datetime"):
+            df[column] = pd.to_datetime(series)
+        elif np.dtype(dtype).kind == "i":
+            df[column] = to_integer(series, dtype)
+        else:
+            df[column] = pd.to_numeric(series, errors="coerce").astype(dtype)
+    return df
+
+
+def memory_usage(df):
+    """Память по колонкам в байтах (с учетом содержимого строк)"""
+    return df.memory_usage(deep=True, index=False)
+
+
+# Доля уникальных значений, при которой строковой колонке подходит тип category
+CATEGORY_MAX_RATIO = 0.5
+
+# Целочисленные типы от меньшего к большему
+INTEGER_TYPES = ("int8", "int16", "int32", "int64")
+
+
+def smallest_integer(low, high):
+    """Наименьший целочисленный тип, в который помещаются значения от low до high"""
+    for dtype in INTEGER_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return "int64"
+
+
+def suggest_dtype(series):
+    """Компактный тип для колонки (текущий, если компактнее не получается)"""
+    dtype = series.dtype
+    values = series.dropna()
+    if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype) \
+            or pd.api.types.is_datetime64_any_dtype(dtype) or values.empty:
+        return str(dtype)
+    if pd.api.types.is_integer_dtype(dtype):
+        return smallest_integer(values.min(), values.max())
+    if pd.api.types.is_float_dtype(dtype):
+        if len(values) == len(series) and (values == np.round(values)).all():
+            return smallest_integer(values.min(), values.max())
+        return "float32"
+    if values.nunique() <= CATEGORY_MAX_RATIO * len(values):
+        return "category"
+    return str(dtype)
+
+
+def value_range(series):
+    """Минимум и максимум колонки (None, если значения не сравниваются)"""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype) and not dtype.ordered:
+        return None, None
+    if not (isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_numeric_dtype(dtype)
+            or pd.api.types.is_datetime64_any_dtype(dtype)):
+        return None, None
+    values = series.dropna()
+    if values.empty:
+        return None, None
+    return values.min(), values.max()
+
+
+def column_profile(dataset):
+    """Профиль колонок: тип, память, пропуски, число значений, диапазон и компактный тип"""
+    df = dataset.view()
+    memory = memory_usage(df)
+    rows = []
+    for column in df.columns:
+        series = df[column]
+        low, high = value_range(series)
+        rows.append({
+            "column": column,
+            "dtype": str(series.dtype),
+            "memory": int(memory[column]),
+            "nulls": int(series.isna().sum()),
+            "unique": int(series.nunique()),
+            "min": low,
+            "max": high,
+            "suggested": suggest_dtype(series),
+        })
+    return pd.DataFrame(rows)
+
+
+def memory_report(before, after):
+    """Печатает сравнение памяти до и после приведения типов"""
+    lines = [f"{'Колонка'.ljust(25)}{'До, МБ'.rjust(12)}{'После, МБ'.rjust(12)}"]
+    for column in after.index:
+        lines.append(f"{str(column).ljust(25)}"
+                     f"{before.get(column, 0) / 2 ** 20:12.2f}"
+                     f"{after[column] / 2 ** 20:12.2f}")
+
+    total_before, total_after = before.sum(), after.sum()
+    ratio = total_before / total_after if total_after else 0
+    lines.append(f"{'Итого'.ljust(25)}{total_before / 2 ** 20:12.2f}{total_after / 2 ** 20:12.2f}"
+                 f"  (в {ratio:.1f} раза меньше)")
+    print("\n".join(lines))
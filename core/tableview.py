@@ -0,0 +1,124 @@
+import operator
+import numpy as np
+import pandas as pd
+from core.schema import BOOL_VALUES
+
+
+# Операции фильтра колонки: название -> сравнение значений колонки со значением фильтра
+FILTER_OPERATORS = {
+    "=": operator.eq,
+    "≠": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    "≥": operator.ge,
+    "≤": operator.le,
+    "содержит": None,
+}
+
+
+def parse_value(series, text):
+    """Значение фильтра из текста в типе колонки series"""
+    text = text.strip()
+    dtype = series.dtype
+    try:
+        if pd.api.types.is_bool_dtype(dtype):
+            return BOOL_VALUES[text.lower()]
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return pd.to_datetime(text, dayfirst=True)
+        if pd.api.types.is_numeric_dtype(dtype):
+            return float(text)
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Значение «{text}» не подходит для колонки {series.name} ({dtype})") from e
+    return text
+
+
+def column_mask(series, op, text):
+    """Маска строк, у которых значение колонки удовлетворяет фильтру (массив bool)"""
+    if op == "содержит":
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Поиск по категориям, а не по строкам таблицы
+            matches = series.cat.categories.astype(str).str.contains(text, case=False, regex=False)
+            codes = series.cat.codes.to_numpy()
+            return np.append(matches, False)[codes]
+        return series.astype(str).str.contains(text, case=False, regex=False).to_numpy()
+
+    value = parse_value(series, text)
+    try:
+        mask = FILTER_OPERATORS[op](series, value)
+    except TypeError as e:
+        raise ValueError(f"Операция «{op}» не поддерживается для колонки {series.name}") from e
+    return np.asarray(mask, dtype=bool)
+
+
+class TableView:
+    """Порядок и отбор строк таблицы без копирования данных.
+
+    Строки задаются массивом позиций в исходной таблице. Перестановки для
+    сортировки по колонке вычисляются при первом запросе и кэшируются,
+    маски фильтров вычисляются векторно по колонкам и тоже сохраняются,
+    поэтому смена сортировки или фильтра - это выборка из готовых массивов.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.sort_column = None
+        self.descending = False
+        # Фильтры по колонкам: колонка -> (операция, текст, маска)
+        self.filters = {}
+        self._orders = {}
+        self._positions = None
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def positions(self):
+        """Позиции показываемых строк в исходной таблице (по порядку показа)"""
+        if self._positions is None:
+            positions = self.order(self.sort_column, self.descending)
+            if self.filters:
+                mask = np.logical_and.reduce([mask for _, _, mask in self.filters.values()])
+                positions = positions[mask[positions]]
+            self._positions = positions
+        return self._positions
+
+    def order(self, column, descending=False):
+        """Перестановка строк для сортировки по колонке (None - исходный порядок)"""
+        if column is None:
+            return np.arange(len(self.frame))
+        key = (column, descending)
+        if key not in self._orders:
+            series = self.frame[column].reset_index(drop=True)
+            self._orders[key] = series.sort_values(ascending=not descending, kind="stable",
+                                                   na_position="last").index.to_numpy()
+        return self._orders[key]
+
+    def sort_by(self, column, descending=False):
+        """Сортирует строки по колонке (None - исходный порядок)"""
+        self.sort_column = column
+        self.descending = descending
+        self._positions = None
+
+    def set_filter(self, column, op, text):
+        """Оставляет строки, у которых значение колонки удовлетворяет фильтру"""
+        mask = column_mask(self.frame[column], op, text)
+        self.filters[column] = (op, text, mask)
+        self._positions = None
+
+    def remove_filter(self, column):
+        self.filters.pop(column, None)
+        self._positions = None
+
+    def clear_filters(self):
+        self.filters.clear()
+        self._positions = None
+
+    def display_indices(self, rows):
+        """Номера в порядке показа для позиций строк rows (скрытые фильтром пропускаются)"""
+        found = np.zeros(len(self.frame), dtype=bool)
+        found[rows] = True
+        return np.flatnonzero(found[self.positions])
+
+    def window(self, start, stop):
+        """Строки с start по stop (не включая) в порядке показа"""
+        return self.frame.iloc[self.positions[start:stop]]
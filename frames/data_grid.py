@@ -0,0 +1,186 @@
+from tkinter import ttk
+from core.tableview import TableView
+
+# Высота строки таблицы (пиксели), как в стиле Treeview
+ROW_HEIGHT = 25
+
+# Сколько строк прокручивает одно деление колеса мыши
+WHEEL_ROWS = 3
+
+# Значки направления сортировки в заголовке колонки
+SORT_MARKS = {False: " ▲", True: " ▼"}
+
+
+class DataGrid(ttk.Frame):
+    """Таблица DataFrame, которая показывает только видимые строки.
+
+    Treeview содержит ровно столько элементов, сколько строк помещается в
+    окне. При прокрутке меняются значения этих элементов: они берутся из
+    колонок таблицы по номерам строк, поэтому открытие таблицы не зависит
+    от числа строк. Вертикальная полоса прокрутки соответствует всем
+    показываемым строкам таблицы.
+
+    Порядок и отбор строк задает TableView (core.tableview): щелчок по
+    заголовку колонки сортирует по ней, фильтры задаются через set_filter.
+    После сортировки или фильтра меняются только значения видимых
+    элементов. on_change вызывается после каждого изменения.
+    """
+
+    def __init__(self, parent, frame, column_width=100, on_change=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.frame = frame
+        self.view = TableView(frame)
+        self.on_change = on_change
+        self.offset = 0
+        self.visible = 0
+        # Номер выделенной строки таблицы (не элемента Treeview)
+        self.selected = None
+
+        self.scroll_y = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scroll_x = ttk.Scrollbar(self, orient="horizontal")
+        self.tree = ttk.Treeview(self, columns=list(frame.columns), show="headings",
+                                 selectmode="browse", xscrollcommand=self.scroll_x.set,
+                                 style="Treeview")
+        self.scroll_x.config(command=self.tree.xview)
+
+        for column in frame.columns:
+            self.tree.heading(column, text=column, command=lambda column=column: self.toggle_sort(column))
+            self.tree.column(column, width=column_width, anchor="center")
+
+        # Чередование цветов строк (по номеру строки таблицы, а не элемента)
+        self.tree.tag_configure('even', background='#f5f5f5')  # светло-серый
+        self.tree.tag_configure('odd', background='white')  # белый
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scroll_y.grid(row=0, column=1, sticky="ns")
+        self.scroll_x.grid(row=1, column=0, sticky="ew")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll_by(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS))
+        self.tree.bind("<Button-4>", lambda event: self.scroll_by(-WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_by(WHEEL_ROWS))
+        for key, step in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "-page"), ("<Next>", "page"),
+                          ("<Home>", "first"), ("<End>", "last")):
+            self.tree.bind(key, lambda event, step=step: self.move_selection(step))
+
+    @property
+    def rows(self):
+        return len(self.view)
+
+    def on_resize(self, event):
+        """Число элементов Treeview под высоту окна"""
+        visible = max(1, (event.height - ROW_HEIGHT) // ROW_HEIGHT)
+        if visible == self.visible:
+            return
+        items = self.tree.get_children()
+        for index in range(len(items), visible):
+            self.tree.insert("", "end", iid=str(index))
+        if len(items) > visible:
+            self.tree.delete(*items[visible:])
+        self.visible = visible
+        self.show(self.offset)
+
+    def show(self, offset):
+        """Заполняет элементы строками таблицы начиная с offset"""
+        self.offset = max(0, min(offset, self.rows - self.visible))
+        window = self.view.window(self.offset, self.offset + self.visible)
+        columns = [window[column].tolist() for column in window.columns]
+
+        self.tree.selection_remove(self.tree.selection())
+        for index, item in enumerate(self.tree.get_children()):
+            row = self.offset + index
+            if index >= len(window):
+                self.tree.item(item, values=(), tags=())
+                continue
+            self.tree.item(item, values=[values[index] for values in columns],
+                           tags=('even' if row % 2 == 0 else 'odd',))
+            if row == self.selected:
+                self.tree.selection_add(item)
+
+        if self.rows:
+            self.scroll_y.set(self.offset / self.rows, (self.offset + len(window)) / self.rows)
+        else:
+            self.scroll_y.set(0, 1)
+
+    def yview(self, *args):
+        """Команда полосы прокрутки: moveto доля или scroll число units/pages"""
+        if args[0] == "moveto":
+            self.show(round(float(args[1]) * self.rows))
+        elif args[0] == "scroll":
+            count = int(args[1])
+            self.scroll_by(count * self.visible if args[2] == "pages" else count)
+
+    def scroll_by(self, count):
+        self.show(self.offset + count)
+        return "break"
+
+    def refresh(self):
+        """Показывает начало таблицы после смены порядка или отбора строк"""
+        self.selected = None
+        self.show(0)
+        if self.on_change is not None:
+            self.on_change()
+
+    def toggle_sort(self, column):
+        """По возрастанию, по убыванию, исходный порядок"""
+        if self.view.sort_column != column:
+            self.sort_by(column)
+        elif not self.view.descending:
+            self.sort_by(column, descending=True)
+        else:
+            self.sort_by(None)
+
+    def sort_by(self, column, descending=False):
+        self.view.sort_by(column, descending)
+        for name in self.frame.columns:
+            mark = SORT_MARKS[descending] if name == column else ""
+            self.tree.heading(name, text=f"{name}{mark}")
+        self.refresh()
+
+    def set_filter(self, column, op, text):
+        """Фильтр колонки (ValueError, если значение не подходит колонке)"""
+        self.view.set_filter(column, op, text)
+        self.refresh()
+
+    def remove_filter(self, column):
+        self.view.remove_filter(column)
+        self.refresh()
+
+    def clear_filters(self):
+        self.view.clear_filters()
+        self.refresh()
+
+    def on_select(self, event):
+        selection = self.tree.selection()
+        if selection and self.offset + self.tree.index(selection[0]) < self.rows:
+            self.selected = self.offset + self.tree.index(selection[0])
+
+    def select_row(self, row):
+        """Выделяет строку row (номер в порядке показа) и прокручивает к ней"""
+        self.selected = row
+        if row < self.offset:
+            self.show(row)
+        elif row >= self.offset + self.visible:
+            self.show(row - self.visible + 1)
+        else:
+            self.show(self.offset)
+        self.tree.focus(str(row - self.offset))
+
+    def move_selection(self, step):
+        """Перемещает выделение с клавиатуры, прокручивая таблицу к строке"""
+        if not self.rows:
+            return "break"
+        if step == "first":
+            row = 0
+        elif step == "last":
+            row = self.rows - 1
+        else:
+            current = self.offset if self.selected is None else self.selected
+            if step in ("page", "-page"):
+                step = self.visible if step == "page" else -self.visible
+            row = max(0, min(current + step, self.rows - 1))
+        self.select_row(row)
+        return "break"
@@ -0,0 +1,46 @@
+from matplotlib.backend_bases import CloseEvent
+
+
+class FigureRegistry:
+    """Живые фигуры matplotlib открытого файла.
+
+    Фигуры строятся без pyplot (core.figures), поэтому после закрытия их
+    никто не удерживает. Фрейм регистрирует фигуру вместе с собой
+    (track): когда фрейм уничтожается, фигура закрывается - останавливаются
+    анимации и удаляются все объекты фигуры вместе с данными графиков.
+    """
+
+    def __init__(self):
+        self.figures = {}
+
+    def track(self, fig, owner):
+        """Закрывает фигуру fig при уничтожении виджета owner и возвращает её"""
+        self.figures[id(fig)] = fig
+        owner.bind("<Destroy>", lambda event: event.widget is owner and self.close(fig), add="+")
+        return fig
+
+    def close(self, fig):
+        """Закрывает фигуру (повторный вызов ничего не делает)"""
+        if self.figures.pop(id(fig), None) is None:
+            return
+        # Как при закрытии окна pyplot: FuncAnimation отключает таймер
+        fig.canvas.callbacks.process("close_event", CloseEvent("close_event", fig.canvas))
+        fig.clear()
+
+    def close_all(self):
+        for fig in list(self.figures.values()):
+            self.close(fig)
+
+    def stats(self):
+        """Число живых фигур и примерный объем их растровых буферов (байт)"""
+        buffer_bytes = 0
+        for fig in self.figures.values():
+            width, height = fig.canvas.get_width_height(physical=True)
+            # Буфер Agg и изображение Tk того же размера
+            copies = 2 if hasattr(fig.canvas, "get_tk_widget") else 1
+            buffer_bytes += width * height * 4 * copies
+        return len(self.figures), buffer_bytes
+
+    def describe(self):
+        count, buffer_bytes = self.stats()
+        return f"Фигур в памяти: {count}, растровые буферы: ~{buffer_bytes / 2 ** 20:.1f} МБ"
@@ -1,6 +1,21 @@
 import seaborn as sns
+import threading
 import tkinter as tk
-from tkinter import ttk
+from types import SimpleNamespace
+from tkinter import ttk, messagebox
+from datetime import datetime, timedelta
+from core.aggregates import SOURCE_COLUMNS, FlightAggregates
+from core.bitmaps import FILTER_COLUMNS, BitmapIndex
+from core.figures import KPI_STYLE
+from core.kpi import KpiEngine
+from core.render import FigureRenderer
+from core.results import DatasetResults
+from core.schema import column_profile
+from core.search import SearchIndex
+from core.tableview import FILTER_OPERATORS
+from frames.data_grid import DataGrid
+from frames.figure_registry import FigureRegistry
+from frames.resize_manager import ResizeManager
 from frames.frame02 import Frame02
 from frames.frame03 import Frame03
 from frames.frame04 import Frame04
@@ -21,32 +36,42 @@ from frames.frame_stat_flight05 import FrameStatFlight05
 from frames.frame_stat_flight06 import FrameStatFlight06
 
 
+# Подпись для вкладок, которым нужны исходные строки
+STREAMING_NOTE = "Файл открыт в потоковом режиме: исходные строки не загружены,\n" \
+                 "доступны только показатели, построенные по дневным агрегатам."
+
+# Формат даты в панели выбора дня для KPI
+KPI_DATE_FORMAT = "%d.%m.%Y"
+
+# Интервал проверки готовности поискового индекса и профиля колонок (мс)
+SEARCH_POLL_MS = 100
+
+# Значение фильтра, при котором колонка не ограничивается
+ALL_VALUES = "Все"
+
+# Сколько фильтров (агрегаты и позиции строк) держать в памяти
+FILTER_CACHE_SIZE = 8
+
+# Колонки панели профиля: поле профиля, заголовок и ширина
+PROFILE_COLUMNS = [
+    ("column", "Колонка", 140),
+    ("dtype", "Тип", 110),
+    ("memory", "Память, МБ", 90),
+    ("nulls", "Пропуски", 80),
+    ("unique", "Значений", 80),
+    ("min", "Минимум", 140),
+    ("max", "Максимум", 140),
+    ("suggested", "Компактный тип", 120),
+]
+
+
 class Frame01(tk.Frame):
-    def __init__(self, parent, current_dataframe):
+    def __init__(self, parent, dataset, aggregates, results=None, renderer=None):
         super().__init__(parent)
         self.configure(borderwidth=2, relief="groove")
 
-        # Стили для графиков
-        self.STYLE1 = {
-            "figsize": (10, 6),
-            "title_fontsize": 12,
-            "title_Y": 0.07,
-            "title_X": 0.97,
-            "title_weight": "bold",
-            "title_ha": "right",
-            "kpi_fontsize": 16,
-            "kpi_weight": "normal",
-            "kpi_1": 0.02,
-            "kpi_2": 1.09,
-            "kpi_pad": 10,
-            "kpi_ha": "left",
-            "kpi_va": "top",
-            "table_fontsize": 14,
-            "header_fontsize": 14,
-            "bbox_table": [0.27, 0.12, 0.73, 0.7],
-            "scale_table": (1, 2),
-            "cell_height": 0.15
-        }
+        # Стили для карточек KPI
+        self.STYLE1 = KPI_STYLE
 
         # Красивый единый стиль графиков
         self.GRAPH_STYLE = {
@@ -62,9 +87,226 @@ class Frame01(tk.Frame):
             "pie_colors": sns.color_palette("Set2")
         }
 
-        self.current_dataframe = current_dataframe
+        self.dataset = dataset
+        self.aggregates = aggregates
+        # Кэш посчитанных графиков и карточек для открытого файла
+        self.results = results or DatasetResults()
+        # Данные всего файла; вкладки показывают их часть по глобальному фильтру
+        self.base_dataset = dataset
+        self.base_aggregates = aggregates
+        self.base_results = self.results
+        self.bitmaps = BitmapIndex(dataset) if dataset is not None else None
+        # Глобальный фильтр: {колонка: значения}, первый и последний день
+        self.global_filter = ({}, None, None)
+        # Наборы данных по фильтрам: область результатов -> (набор, агрегаты, результаты)
+        self.filtered = {None: (dataset, aggregates, self.results)}
+        # Графики, которые перестраиваются при изменении своих данных (add_chart)
+        self.chart_slots = []
+        # Фоновая отрисовка изображений карточек KPI для экспорта
+        self.renderer = renderer or FigureRenderer()
+        # Фигуры вкладок закрываются вместе со своими фреймами
+        self.figures = FigureRegistry()
+        # Общая обработка изменения размера графиков обзора
+        self.resize_manager = ResizeManager(self)
+        # Карточки KPI считаются по одному дневному кубу метрик
+        self.kpi = KpiEngine(aggregates)
+        self.kpi_day = self.kpi.latest_date
+        self.create_filter_bar()
         self.create_widgets()
 
+    def create_filter_bar(self):
+        """Панель глобального фильтра, который учитывают все вкладки"""
+        bar = ttk.Frame(self)
+        bar.pack(fill="x", padx=5, pady=(5, 0))
+        if self.bitmaps is None:
+            ttk.Label(bar, text="Фильтры недоступны: " + STREAMING_NOTE.splitlines()[0].lower(),
+                      font=('Segoe UI', 9)).pack(side="left", padx=5)
+            return
+
+        self.filter_boxes = {}
+        for column, title in FILTER_COLUMNS.items():
+            if column not in self.bitmaps.columns:
+                continue
+            ttk.Label(bar, text=f"{title}:", font=('Segoe UI', 9, 'bold')).pack(side="left", padx=(5, 2))
+            values = [ALL_VALUES] + [str(value) for value in self.bitmaps.values(column)]
+            box = ttk.Combobox(bar, values=values, state="readonly",
+                               width=min(max(len(value) for value in values) + 2, 22))
+            box.set(ALL_VALUES)
+            box.pack(side="left")
+            self.filter_boxes[column] = box
+
+        ttk.Label(bar, text="Даты:", font=('Segoe UI', 9, 'bold')).pack(side="left", padx=(10, 2))
+        self.filter_start = tk.StringVar(value=self.base_aggregates.days.first.strftime(KPI_DATE_FORMAT))
+        self.filter_end = tk.StringVar(value=self.base_aggregates.latest_date.strftime(KPI_DATE_FORMAT))
+        ttk.Entry(bar, textvariable=self.filter_start, width=11, justify="center").pack(side="left")
+        ttk.Label(bar, text="–").pack(side="left")
+        ttk.Entry(bar, textvariable=self.filter_end, width=11, justify="center").pack(side="left")
+
+        ttk.Button(bar, text="Применить", command=self.apply_global_filter).pack(side="left", padx=(10, 2))
+        ttk.Button(bar, text="Сбросить", command=self.reset_global_filter).pack(side="left", padx=2)
+        self.filter_info = ttk.Label(bar, font=('Segoe UI', 9))
+        self.filter_info.pack(side="left", padx=10)
+
+    def apply_global_filter(self):
+        """Фильтр из значений панели"""
+        try:
+            start = datetime.strptime(self.filter_start.get().strip(), KPI_DATE_FORMAT).date()
+            end = datetime.strptime(self.filter_end.get().strip(), KPI_DATE_FORMAT).date()
+        except ValueError:
+            messagebox.showerror("Ошибка", "Введите даты в формате ДД.ММ.ГГГГ")
+            return
+        selection = {column: [box.get()] for column, box in self.filter_boxes.items() if box.get() != ALL_VALUES}
+        self.set_global_filter(selection, start, end)
+
+    def reset_global_filter(self):
+        for box in self.filter_boxes.values():
+            box.set(ALL_VALUES)
+        self.filter_start.set(self.base_aggregates.days.first.strftime(KPI_DATE_FORMAT))
+        self.filter_end.set(self.base_aggregates.latest_date.strftime(KPI_DATE_FORMAT))
+        self.set_global_filter({}, None, None)
+
+    @staticmethod
+    def filter_scope(selection, start, end):
+        """Область результатов для фильтра (None - весь файл)"""
+        if not selection and start is None and end is None:
+            return None
+        return repr((sorted(selection.items()), start, end))
+
+    def filtered_data(self, selection, start=None, end=None):
+        """Набор данных, агрегаты и результаты для фильтра (None, если строк нет).
+
+        Диапазон дат не пересчитывает агрегаты: набор и агрегаты фильтра по
+        значениям (или всего файла) срезаются по дням (period, between).
+        Строки фильтра по значениям отбираются битовыми масками
+        (core.bitmaps); агрегаты считаются один раз по нужным колонкам этих
+        строк, а сам набор копирует строки, только когда вкладке нужны
+        исходные строки. Наборы последних фильтров хранятся в памяти, а
+        результаты графиков для каждого фильтра кэшируются отдельно
+        (DatasetResults.scoped).
+        """
+        scope = self.filter_scope(selection, start, end)
+        if scope not in self.filtered:
+            if start is not None or end is not None:
+                data = self.filtered_data(selection)
+                if data is None:
+                    return None
+                dataset, aggregates, _ = data
+                start, end = start or aggregates.days.first, end or aggregates.latest_date
+                lo, hi = aggregates.days.bounds(start, end)
+                if hi == lo:
+                    return None
+                dataset, aggregates = dataset.period(start, end), aggregates.between(start, end)
+            else:
+                rows = self.bitmaps.select(selection)
+                if not len(rows):
+                    return None
+                dataset = self.base_dataset.subset(rows)
+                aggregates = FlightAggregates.from_dataframe(self.base_dataset.take(rows, SOURCE_COLUMNS))
+            if len(self.filtered) > FILTER_CACHE_SIZE:
+                # Вытесняем самый старый фильтр (весь файл остается всегда)
+                del self.filtered[next(scope for scope in self.filtered if scope is not None)]
+            self.filtered[scope] = (dataset, aggregates, self.base_results.scoped(scope))
+        return self.filtered[scope]
+
+    def set_global_filter(self, selection, start=None, end=None):
+        """Показывает во вкладках только строки, подходящие под фильтр"""
+        first, last = self.base_aggregates.days.first, self.base_aggregates.latest_date
+        start = None if start is None or start <= first else start
+        end = None if end is None or end >= last else end
+        if (selection, start, end) == self.global_filter:
+            return
+
+        data = self.filtered_data(selection, start, end)
+        if data is None:
+            messagebox.showwarning("Фильтр", "Нет рейсов, подходящих под фильтр")
+            return
+
+        self.global_filter = (selection, start, end)
+        self.dataset, self.aggregates, self.results = data
+        # Скопированные строки держит в памяти только текущий фильтр
+        for dataset, _, _ in self.filtered.values():
+            if dataset is not self.dataset:
+                dataset.release()
+        self.kpi = KpiEngine(self.aggregates)
+        self.kpi_day = self.kpi.latest_date
+        self.filter_info.config(text="" if self.dataset is self.base_dataset else
+                                f"Рейсов: {len(self.dataset)} из {len(self.base_dataset)}")
+        for column, box in self.filter_boxes.items():
+            box.set(selection[column][0] if column in selection else ALL_VALUES)
+        self.refresh_tabs()
+
+    def cross_filter(self, column, value):
+        """Фильтр по щелчку на столбце графика; повторный щелчок снимает его"""
+        if self.bitmaps is None:
+            return  # Потоковый режим: строк для фильтра нет
+        selection, start, end = self.global_filter
+        selection = dict(selection)
+        if selection.get(column) == [value]:
+            del selection[column]
+        else:
+            selection[column] = [value]
+        self.set_global_filter(selection, start, end)
+
+    def refresh_tabs(self):
+        """Обновляет вкладки под новый фильтр.
+
+        Данные и карточки KPI зависят от всего фильтра: построенные вкладки
+        очищаются и строятся заново при открытии. Графики перестраиваются,
+        только если изменились их собственные данные (fill_slot), и только
+        на открытой вкладке - остальные при её открытии.
+        """
+        for tab, builder in ((self.tab0, self.create_tab0_content), (self.tab1, self.create_tab1_content)):
+            if str(tab) not in self.tab_builders:
+                for child in tab.winfo_children():
+                    child.destroy()
+                self.tab_builders[str(tab)] = builder
+        self.on_tab_changed()
+
+    def add_chart(self, parent, create, dimension=None):
+        """Контейнер графика, который перестраивается при изменении его данных.
+
+        create(parent, dataset, aggregates, results, selected) создает фрейм
+        графика. dimension - колонка, по которой график сам задает фильтр
+        щелчком: фильтр по ней к графику не применяется (иначе остался бы
+        один столбец), а выбранное значение передается как selected.
+        Контейнер размещается вызывающим кодом.
+        """
+        slot = SimpleNamespace(holder=tk.Frame(parent), create=create, dimension=dimension, scope=None, chart=None)
+        self.chart_slots.append(slot)
+        self.fill_slot(slot)
+        return slot.holder
+
+    def fill_slot(self, slot):
+        """Строит график контейнера, если его данные изменились"""
+        selection, start, end = self.global_filter
+        selected = None
+        if slot.dimension is not None:
+            selected = selection.get(slot.dimension, [None])[0]
+            selection = {column: values for column, values in selection.items() if column != slot.dimension}
+        scope = self.filter_scope(selection, start, end)
+
+        if slot.chart is not None and scope == slot.scope:
+            if slot.dimension is not None:
+                slot.chart.show_selected(selected)
+            return
+        try:
+            chart = slot.create(slot.holder, *self.filtered_data(selection, start, end), selected)
+        except Exception as e:
+            # Вместо графика - сообщение об ошибке; при следующем обновлении график строится снова
+            for child in slot.holder.winfo_children():
+                child.destroy()
+            slot.chart, slot.scope = None, None
+            tk.Label(slot.holder, text=f"Ошибка при создании графика: {str(e)}", fg="red",
+                     wraplength=300).pack(expand=True)
+            return
+
+        # Прежний график (или сообщение об ошибке) убирается, только когда новый построен
+        for child in slot.holder.winfo_children():
+            if child is not chart:
+                child.destroy()
+        chart.pack(fill="both", expand=True)
+        slot.chart, slot.scope = chart, scope
+
     def create_widgets(self):
         """Метод для создания виджетов фрейма"""
         # Создаем Notebook
@@ -84,40 +326,98 @@ class Frame01(tk.Frame):
         self.notebook.add(self.tab3, text="Cтатистика Пассажиропоток")
         self.notebook.add(self.tab4, text="Cтатистика Рейсы")
 
-        # Добавляем содержимое вкладок
-        self.create_tab0_content()
-        self.create_tab1_content()
-        self.create_tab2_content()
-        self.create_tab3_content()
-        self.create_tab4_content()
+        # Содержимое вкладки строится при первом её открытии,
+        # поэтому вкладки, которые пользователь не открывал, ничего не стоят
+        self.tab_builders = {
+            str(self.tab0): self.create_tab0_content,
+            str(self.tab1): self.create_tab1_content,
+            str(self.tab2): self.create_tab2_content,
+            str(self.tab3): self.create_tab3_content,
+            str(self.tab4): self.create_tab4_content,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+        # Анимированный график обзора (создается вместе с вкладкой)
+        self.animated_overview = None
+
+        # Первая вкладка уже выбрана, событие для неё не придет
+        self.on_tab_changed()
+
+    def on_tab_changed(self, event=None):
+        """Строит содержимое выбранной вкладки, если она открыта впервые"""
+        selected = self.notebook.select()
+        builder = self.tab_builders.pop(selected, None)
+        if builder is not None:
+            builder()
+
+        # Графики вкладки, данные которых изменились после смены фильтра
+        for slot in self.chart_slots:
+            if str(slot.holder).startswith(f"{selected}."):
+                self.fill_slot(slot)
+
+        # Анимация обзора не тратит процессор, пока её вкладка скрыта
+        if self.animated_overview is not None:
+            self.animated_overview.set_active(selected == str(self.tab2))
+
+    def destroy(self):
+        """Закрывает все фигуры вкладок вместе с фреймом"""
+        super().destroy()
+        self.figures.close_all()
+
+    def create_streaming_note(self, parent):
+        """Подпись вместо содержимого, требующего исходных строк"""
+        label = ttk.Label(parent, text=STREAMING_NOTE, font=('Segoe UI', 10), justify="center")
+        label.pack(expand=True, padx=10, pady=10)
+        return label
 
     def create_tab0_content(self):
         """Создаем содержимое вкладки с данными"""
+        if self.dataset is None:
+            ttk.Label(self.tab0,
+                      text=f"Записей: {self.aggregates.rows}, дней: {len(self.aggregates.daily)}",
+                      font=('Segoe UI', 10, 'bold')).pack(anchor="w", padx=10, pady=5)
+            self.create_streaming_note(self.tab0)
+            return
+
         # Панель с информацией о DataFrame
         info_frame = ttk.Frame(self.tab0)
         info_frame.pack(fill="x", padx=5, pady=5)
 
         # Информация о размере DataFrame с улучшенным шрифтом
-        ttk.Label(info_frame,
-                  text=f"Записей: {len(self.current_dataframe)}, Колонок: {len(self.current_dataframe.columns)}",
-                  font=('Segoe UI', 10, 'bold')).pack(side="left", padx=5)
+        self.table_info = ttk.Label(info_frame, font=('Segoe UI', 10, 'bold'))
+        self.table_info.pack(side="left", padx=5)
 
-        # Стилизованная кнопка для отображения информации о типах данных
-        ttk.Button(info_frame, text="Показать типы данных",
+        # Стилизованная кнопка для отображения профиля колонок
+        ttk.Button(info_frame, text="Профиль колонок",
                    command=self.show_dtypes,
                    style='Accent.TButton').pack(side="right", padx=5)
 
+        # Панель фильтров по колонкам
+        filter_frame = ttk.Frame(self.tab0)
+        filter_frame.pack(fill="x", padx=5)
+
         # Создаем фрейм для таблицы с прокруткой
         table_frame = ttk.Frame(self.tab0)
         table_frame.pack(expand=True, fill="both", padx=5, pady=5)
 
-        # Создаем Treeview для отображения данных
+        # Таблица показывает только видимые строки данных
         self.create_data_table(table_frame)
+        self.create_table_filters(filter_frame)
+        self.create_table_search(info_frame)
+        self.update_table_info()
 
-        # Фрейм для отображения информации о типах данных
+        # Фрейм для профиля колонок (считается при первом открытии)
         self.dtypes_frame = ttk.Frame(self.tab0)
-        self.dtypes_label = ttk.Label(self.dtypes_frame, text="", font=('Segoe UI', 9))
-        self.dtypes_label.pack(padx=5, pady=5)
+        self.dtypes_label = ttk.Label(self.dtypes_frame, text="", font=('Segoe UI', 9, 'bold'))
+        self.dtypes_label.pack(anchor="w", padx=5, pady=5)
+        self.profile_table = ttk.Treeview(self.dtypes_frame, columns=[name for name, _, _ in PROFILE_COLUMNS],
+                                          show="headings", height=len(self.dataset.columns))
+        for name, title, width in PROFILE_COLUMNS:
+            self.profile_table.heading(name, text=title)
+            self.profile_table.column(name, width=width, anchor="w" if name == "column" else "center")
+        self.profile_table.pack(fill="x", padx=5, pady=(0, 5))
+        self.column_profile = None
+        self.profile_thread = None
 
     def create_data_table(self, parent):
         """Создает таблицу для отображения данных"""
@@ -140,55 +440,173 @@ class Frame01(tk.Frame):
         style.map("Treeview.Row",
                   background=[('!selected', '#f5f5f5'), ('!selected', 'white')])  # светло-серый и белый
 
-        # Создаем Treeview с прокруткой
-        scroll_y = ttk.Scrollbar(parent, orient="vertical")
-        scroll_x = ttk.Scrollbar(parent, orient="horizontal")
-
-        self.data_table = ttk.Treeview(parent,
-                                       yscrollcommand=scroll_y.set,
-                                       xscrollcommand=scroll_x.set,
-                                       style="Treeview")
-
-        scroll_y.config(command=self.data_table.yview)
-        scroll_x.config(command=self.data_table.xview)
-
-        # Настройка колонок
-        self.data_table["columns"] = list(self.current_dataframe.columns)
-        self.data_table["show"] = "headings"
-
-        # Заголовки колонок
-        for column in self.current_dataframe.columns:
-            self.data_table.heading(column, text=column)
-            self.data_table.column(column, width=100, anchor="center")
-
-        # Добавляем данные с чередованием цветов
-        for i, (_, row) in enumerate(self.current_dataframe.iterrows()):
-            tag = 'even' if i % 2 == 0 else 'odd'
-            self.data_table.insert("", "end", values=list(row), tags=(tag,))
-
-        # Настраиваем теги для чередования цветов
-        self.data_table.tag_configure('even', background='#f5f5f5')  # светло-серый
-        self.data_table.tag_configure('odd', background='white')  # белый
-
-        # Размещаем элементы
-        self.data_table.grid(row=0, column=0, sticky="nsew")
-        scroll_y.grid(row=0, column=1, sticky="ns")
-        scroll_x.grid(row=1, column=0, sticky="ew")
-
-        # Настройка grid
-        parent.grid_columnconfigure(0, weight=1)
-        parent.grid_rowconfigure(0, weight=1)
+        # Строки берутся из представления таблицы по мере прокрутки
+        self.data_table = DataGrid(parent, self.dataset.view(), on_change=self.update_table_info)
+        self.data_table.pack(expand=True, fill="both")
+
+    def create_table_filters(self, parent):
+        """Фильтр по колонке: колонка, операция и значение"""
+        columns = list(self.dataset.columns)
+        ttk.Label(parent, text="Фильтр:", font=('Segoe UI', 9, 'bold')).pack(side="left", padx=5)
+
+        self.filter_column = ttk.Combobox(parent, values=columns, state="readonly", width=18)
+        self.filter_column.set(columns[0])
+        self.filter_column.pack(side="left", padx=2)
+
+        self.filter_operator = ttk.Combobox(parent, values=list(FILTER_OPERATORS), state="readonly", width=9)
+        self.filter_operator.set("=")
+        self.filter_operator.pack(side="left", padx=2)
+
+        self.filter_value = ttk.Entry(parent, width=20)
+        self.filter_value.pack(side="left", padx=2)
+        self.filter_value.bind("<Return>", lambda event: self.apply_table_filter())
+
+        ttk.Button(parent, text="Применить", command=self.apply_table_filter).pack(side="left", padx=2)
+        ttk.Button(parent, text="Убрать", command=lambda: self.data_table.remove_filter(
+            self.filter_column.get())).pack(side="left", padx=2)
+        ttk.Button(parent, text="Сбросить все", command=self.data_table.clear_filters).pack(side="left", padx=2)
+
+        self.filter_summary = ttk.Label(parent, font=('Segoe UI', 9))
+        self.filter_summary.pack(side="left", padx=10)
+
+    def apply_table_filter(self):
+        """Добавляет или заменяет фильтр выбранной колонки"""
+        try:
+            self.data_table.set_filter(self.filter_column.get(), self.filter_operator.get(),
+                                       self.filter_value.get())
+        except ValueError as e:
+            messagebox.showerror("Ошибка", str(e))
+
+    def create_table_search(self, parent):
+        """Поиск по строковым колонкам; индекс строится в фоне"""
+        search_frame = ttk.Frame(parent)
+        search_frame.pack(side="left", padx=20)
+
+        ttk.Label(search_frame, text="Поиск:", font=('Segoe UI', 9, 'bold')).pack(side="left", padx=2)
+        self.search_entry = ttk.Entry(search_frame, width=30, state="disabled")
+        self.search_entry.pack(side="left", padx=2)
+        self.search_entry.bind("<Return>", lambda event: self.run_search())
+        ttk.Button(search_frame, text="Найти", command=self.run_search).pack(side="left", padx=2)
+        ttk.Button(search_frame, text="◀", width=3, command=lambda: self.show_search_hit(-1)).pack(side="left")
+        ttk.Button(search_frame, text="▶", width=3, command=lambda: self.show_search_hit(1)).pack(side="left")
+        self.search_info = ttk.Label(search_frame, text="Индекс поиска строится...", font=('Segoe UI', 9))
+        self.search_info.pack(side="left", padx=5)
+
+        # Найденные строки (позиции в таблице) и их номера в порядке показа
+        self.search_rows = None
+        self.search_hits = []
+        self.search_hit = -1
+        self.search_index = SearchIndex(self.data_table.frame)
+        threading.Thread(target=self.search_index.build, daemon=True).start()
+        self.after(SEARCH_POLL_MS, self.poll_search_index, self.search_index)
+
+    def poll_search_index(self, index):
+        """Разрешает поиск, когда индекс построен"""
+        if index is not self.search_index or not self.search_entry.winfo_exists():
+            return  # Вкладка построена заново по другому фильтру
+        if not index.ready.is_set():
+            self.after(SEARCH_POLL_MS, self.poll_search_index, index)
+            return
+        self.search_entry.config(state="normal")
+        self.search_info.config(text=f"Колонки: {', '.join(self.search_index.columns)}")
+
+    def run_search(self):
+        """Ищет строки со всеми словами запроса и переходит к первой"""
+        if not self.search_index.ready.is_set():
+            return
+        query = self.search_entry.get()
+        self.search_rows = self.search_index.search(query) if query.strip() else None
+        self.update_search_hits()
+        self.show_search_hit(0)
+
+    def update_search_hits(self):
+        """Номера найденных строк в текущем порядке и отборе таблицы"""
+        self.search_hit = -1
+        if self.search_rows is None:
+            self.search_hits = []
+            return
+        self.search_hits = self.data_table.view.display_indices(self.search_rows)
+
+    def show_search_hit(self, step):
+        """Переходит к следующему (step=1) или предыдущему (step=-1) совпадению"""
+        if self.search_rows is None:
+            self.search_info.config(text="")
+            return
+        if not len(self.search_hits):
+            hidden = len(self.search_rows)
+            self.search_info.config(text="Совпадений нет" if not hidden else
+                                    f"Совпадений: {hidden}, все скрыты фильтром")
+            return
+        self.search_hit = (self.search_hit + step) % len(self.search_hits) if self.search_hit >= 0 else 0
+        self.data_table.select_row(int(self.search_hits[self.search_hit]))
+        self.search_info.config(text=f"Совпадение {self.search_hit + 1} из {len(self.search_hits)}")
+
+    def update_table_info(self):
+        """Число показанных строк и активные фильтры"""
+        if self.search_rows is not None:
+            # Совпадения поиска пересчитываются под новый порядок строк
+            self.update_search_hits()
+            self.show_search_hit(0)
+        view = self.data_table.view
+        shown = f"Записей: {len(self.dataset)}, Колонок: {len(self.dataset.columns)}"
+        if view.filters:
+            shown += f", после фильтра: {len(view)}"
+        self.table_info.config(text=shown)
+        self.filter_summary.config(text="; ".join(f"{column} {op} {text}"
+                                                  for column, (op, text, _) in view.filters.items()))
 
     def show_dtypes(self):
-        """Отображает информацию о типах данных"""
-        dtypes_info = "\n".join([f"{col.ljust(25)}{dtype}"
-                                 for col, dtype in self.current_dataframe.dtypes.items()])
-
-        if not self.dtypes_frame.winfo_ismapped():
-            self.dtypes_frame.pack(fill="x", padx=5, pady=5)
-            self.dtypes_label.config(text=dtypes_info)
-        else:
+        """Показывает или скрывает профиль колонок"""
+        if self.dtypes_frame.winfo_ismapped():
             self.dtypes_frame.pack_forget()
+            return
+        self.dtypes_frame.pack(fill="x", padx=5, pady=5)
+        if self.column_profile is None and self.profile_thread is None:
+            # Профиль считается в фоне и сохраняется в кэше результатов файла
+            self.dtypes_label.config(text="Профиль колонок считается...")
+            self.profile_thread = threading.Thread(target=self.compute_column_profile,
+                                                   args=(self.dataset, self.results), daemon=True)
+            self.profile_thread.start()
+            self.after(SEARCH_POLL_MS, self.poll_column_profile, self.profile_thread)
+
+    @staticmethod
+    def compute_column_profile(dataset, results):
+        """Профиль колонок в фоновом потоке (результат - в атрибуте потока)"""
+        thread = threading.current_thread()
+        try:
+            thread.result = results.get(column_profile, dataset)
+        except Exception as e:
+            thread.result = e
+
+    def poll_column_profile(self, thread):
+        """Заполняет панель, когда профиль посчитан"""
+        if thread is not self.profile_thread or not self.dtypes_frame.winfo_exists():
+            return  # Вкладка построена заново по другому фильтру
+        if thread.is_alive():
+            self.after(SEARCH_POLL_MS, self.poll_column_profile, thread)
+            return
+        self.profile_thread = None
+        profile = thread.result
+        if isinstance(profile, Exception):
+            self.dtypes_label.config(text=f"Не удалось посчитать профиль: {profile}")
+            return
+
+        self.column_profile = profile
+        self.dtypes_label.config(text=f"Память таблицы: {profile['memory'].sum() / 2 ** 20:.2f} МБ, "
+                                      f"компактный тип предложен для "
+                                      f"{(profile['suggested'] != profile['dtype']).sum()} колонок")
+        for _, row in profile.iterrows():
+            values = []
+            for name, _, _ in PROFILE_COLUMNS:
+                value = row[name]
+                if name == "memory":
+                    value = f"{value / 2 ** 20:.2f}"
+                elif value is None:
+                    value = "-"
+                elif name == "suggested" and value == row["dtype"]:
+                    value = "-"
+                values.append(value)
+            self.profile_table.insert("", "end", values=values)
 
     def create_tab1_content(self):
         """Создаем содержимое первой вкладки"""
@@ -197,38 +615,91 @@ class Frame01(tk.Frame):
         self.tab1.grid_columnconfigure(1, weight=1)
         self.tab1.grid_columnconfigure(2, weight=1)
 
-        self.tab1.grid_rowconfigure(0, weight=1)
+        self.tab1.grid_rowconfigure(0, weight=0)
         self.tab1.grid_rowconfigure(1, weight=1)
         self.tab1.grid_rowconfigure(2, weight=1)
         self.tab1.grid_rowconfigure(3, weight=1)
 
-        # Создаем фреймы во вкладке 1
-        self.frame2 = Frame02(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame2.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-
-        self.frame3 = Frame03(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame3.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-
-        self.frame4 = Frame04(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame4.grid(row=0, column=2, sticky="nsew", padx=5, pady=5)
-
-        self.frame5 = Frame05(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame5.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
-
-        self.frame6 = Frame06(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame6.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
-
-        self.frame7 = Frame07(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame7.grid(row=1, column=2, sticky="nsew", padx=5, pady=5)
+        # Панель выбора дня
+        self.create_kpi_toolbar()
 
-        self.frame8 = Frame08(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame8.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
-
-        self.frame9 = Frame09(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame9.grid(row=2, column=1, sticky="nsew", padx=5, pady=5)
-
-        self.frame10 = Frame10(self.tab1, self.STYLE1, self.current_dataframe)
-        self.frame10.grid(row=2, column=2, sticky="nsew", padx=5, pady=5)
+        # Создаем фреймы во вкладке 1
+        self.frame2 = Frame02(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame2.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+
+        self.frame3 = Frame03(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame3.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
+
+        self.frame4 = Frame04(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame4.grid(row=1, column=2, sticky="nsew", padx=5, pady=5)
+
+        self.frame5 = Frame05(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame5.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+
+        self.frame6 = Frame06(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame6.grid(row=2, column=1, sticky="nsew", padx=5, pady=5)
+
+        self.frame7 = Frame07(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame7.grid(row=2, column=2, sticky="nsew", padx=5, pady=5)
+
+        self.frame8 = Frame08(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame8.grid(row=3, column=0, sticky="nsew", padx=5, pady=5)
+
+        self.frame9 = Frame09(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame9.grid(row=3, column=1, sticky="nsew", padx=5, pady=5)
+
+        self.frame10 = Frame10(self.tab1, self.STYLE1, self.kpi, self.renderer)
+        self.frame10.grid(row=3, column=2, sticky="nsew", padx=5, pady=5)
+
+        self.kpi_frames = [self.frame2, self.frame3, self.frame4, self.frame5, self.frame6,
+                           self.frame7, self.frame8, self.frame9, self.frame10]
+
+    def create_kpi_toolbar(self):
+        """Панель выбора дня, за который показываются карточки KPI"""
+        toolbar = ttk.Frame(self.tab1)
+        toolbar.grid(row=0, column=0, columnspan=3, sticky="ew", padx=5, pady=(5, 0))
+
+        ttk.Label(toolbar, text="Дата:", font=('Segoe UI', 10, 'bold')).pack(side="left", padx=5)
+        ttk.Button(toolbar, text="◀", width=3,
+                   command=lambda: self.shift_kpi_day(-1)).pack(side="left")
+
+        self.kpi_day_var = tk.StringVar(value=self.kpi_day.strftime(KPI_DATE_FORMAT))
+        day_entry = ttk.Entry(toolbar, textvariable=self.kpi_day_var, width=12, justify="center")
+        day_entry.pack(side="left", padx=2)
+        day_entry.bind("<Return>", lambda event: self.apply_kpi_day())
+
+        ttk.Button(toolbar, text="▶", width=3,
+                   command=lambda: self.shift_kpi_day(1)).pack(side="left")
+        ttk.Button(toolbar, text="Показать",
+                   command=self.apply_kpi_day).pack(side="left", padx=5)
+        ttk.Button(toolbar, text="Последний день",
+                   command=lambda: self.show_kpi_day(self.kpi.latest_date)).pack(side="left")
+
+        ttk.Label(toolbar,
+                  text=f"Данные с {self.kpi.first_date.strftime(KPI_DATE_FORMAT)} "
+                       f"по {self.kpi.latest_date.strftime(KPI_DATE_FORMAT)}",
+                  font=('Segoe UI', 9)).pack(side="right", padx=5)
+
+    def show_kpi_day(self, day):
+        """Перерисовывает карточки KPI за выбранный день"""
+        day = min(max(day, self.kpi.first_date), self.kpi.latest_date)
+        self.kpi_day = day
+        self.kpi_day_var.set(day.strftime(KPI_DATE_FORMAT))
+        for frame in self.kpi_frames:
+            frame.show_day(day)
+
+    def shift_kpi_day(self, step):
+        """Переходит на step дней вперед или назад"""
+        self.show_kpi_day(self.kpi_day + timedelta(days=step))
+
+    def apply_kpi_day(self):
+        """Показывает карточки за дату, введенную в поле"""
+        try:
+            day = datetime.strptime(self.kpi_day_var.get().strip(), KPI_DATE_FORMAT).date()
+        except ValueError:
+            messagebox.showerror("Ошибка", "Введите дату в формате ДД.ММ.ГГГГ")
+            return
+        self.show_kpi_day(day)
 
     def create_tab2_content(self):
         """Создаем содержимое вкладки Обзор на сегодня"""
@@ -237,17 +708,34 @@ class Frame01(tk.Frame):
         self.tab2.grid_columnconfigure(1, weight=1)
         self.tab2.grid_columnconfigure(2, weight=1)
 
-        overview1 = FrameOverview01(self.tab2, self.current_dataframe, self.GRAPH_STYLE)
+        overview1 = self.add_chart(self.tab2, lambda parent, dataset, aggregates, results, selected: FrameOverview01(
+            parent, aggregates, self.GRAPH_STYLE, self.resize_manager, self.figures))
         overview1.grid(row=1, column=1, columnspan=2, sticky="nsew", padx=5, pady=5)
 
-        overview2 = FrameOverview02(self.tab2, self.current_dataframe, self.GRAPH_STYLE)
+        overview2 = self.add_chart(self.tab2, lambda parent, dataset, aggregates, results, selected: FrameOverview02(
+            parent, aggregates, self.GRAPH_STYLE, self.resize_manager, self.figures))
         overview2.grid(row=2, column=1, sticky="nsew", padx=5, pady=5)
 
-        overview3 = FrameOverview03(self.tab2, self.current_dataframe, self.GRAPH_STYLE)
+        if self.dataset is None:
+            overview3 = ttk.Frame(self.tab2)
+            self.create_streaming_note(overview3)
+        else:
+            # Щелчок по направлению фильтрует остальные графики
+            overview3 = self.add_chart(self.tab2, self.create_top_routes, dimension="Airport_arr")
         overview3.grid(row=2, column=2, sticky="nsew", padx=5, pady=5)
 
+    def create_top_routes(self, parent, dataset, aggregates, results, selected):
+        """Анимированный топ направлений (анимация идет, только пока вкладка открыта)"""
+        self.animated_overview = FrameOverview03(parent, dataset, self.GRAPH_STYLE, self.resize_manager,
+                                                 self.figures, on_select=self.cross_filter, selected=selected)
+        self.animated_overview.set_active(self.notebook.select() == str(self.tab2))
+        return self.animated_overview
+
     def create_tab3_content(self):
         """Создаем содержимое вкладки Общая статистика пассажиропотока"""
+        if self.dataset is None:
+            self.create_streaming_note(self.tab3)
+            return
 
         # Создаем PanedWindow с вертикальной ориентацией
         self.paned = ttk.PanedWindow(self.tab3, orient="vertical")
@@ -258,10 +746,12 @@ class Frame01(tk.Frame):
         self.tab3.grid_rowconfigure(0, weight=1)
 
         # Добавляем фреймы в PanedWindow
-        self.stat_frame1 = FrameStatPassengers01(self.paned, self.current_dataframe)
+        self.stat_frame1 = self.add_chart(self.paned, lambda parent, dataset, aggregates, results, selected:
+                                          FrameStatPassengers01(parent, dataset, results, self.figures))
         self.paned.add(self.stat_frame1, weight=1)
 
-        self.stat_frame2 = FrameStatPassengers02(self.paned, self.current_dataframe)
+        self.stat_frame2 = self.add_chart(self.paned, lambda parent, dataset, aggregates, results, selected:
+                                          FrameStatPassengers02(parent, dataset, results, self.figures))
         self.paned.add(self.stat_frame2, weight=1)
 
     def create_tab4_content(self):
@@ -272,14 +762,21 @@ class Frame01(tk.Frame):
         for j in range(2):
             self.tab4.grid_rowconfigure(j, weight=1)
 
-        self.stat_frame3 = FrameStatFlight03(self.tab4, self.current_dataframe)
+        self.stat_frame3 = self.add_chart(self.tab4, lambda parent, dataset, aggregates, results, selected:
+                                          FrameStatFlight03(parent, aggregates, self.figures))
         self.stat_frame3.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
 
-        self.stat_frame4 = FrameStatFlight04(self.tab4, self.current_dataframe)
+        self.stat_frame4 = self.add_chart(self.tab4, lambda parent, dataset, aggregates, results, selected:
+                                          FrameStatFlight04(parent, aggregates, self.figures))
         self.stat_frame4.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
 
-        self.stat_frame5 = FrameStatFlight05(self.tab4, self.current_dataframe)
+        # Щелчок по авиакомпании в топах фильтрует остальные графики
+        self.stat_frame5 = self.add_chart(self.tab4, lambda parent, dataset, aggregates, results, selected:
+                                          FrameStatFlight05(parent, aggregates, self.figures, self.cross_filter,
+                                                            selected), dimension="Airline_name")
         self.stat_frame5.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
 
-        self.stat_frame6 = FrameStatFlight06(self.tab4, self.current_dataframe)
+        self.stat_frame6 = self.add_chart(self.tab4, lambda parent, dataset, aggregates, results, selected:
+                                          FrameStatFlight06(parent, aggregates, self.figures, self.cross_filter,
+                                                            selected), dimension="Airline_name")
         self.stat_frame6.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
@@ -0,0 +1,224 @@
+import tkinter as tk
+from tkinter import filedialog, font, messagebox
+from matplotlib.colors import to_hex, to_rgb
+from PIL import Image
+from core.figures import KPI_CARDS, kpi_card_figure, kpi_cell_colors, kpi_table_text
+
+# Интервал опроса фоновой отрисовки изображения для экспорта (мс)
+RENDER_POLL_MS = 50
+
+# Пауза после изменения размера перед подбором шрифтов (мс)
+RESIZE_DELAY_MS = 150
+
+# Размер карточки (пиксели), для которого подобраны базовые размеры шрифтов
+BASE_SIZE = (420, 250)
+
+# Базовые размеры шрифтов: значение за день, таблица, заголовки таблицы, дата
+FONT_SIZES = {"headline": 13, "cell": 10, "header": 10, "date": 9}
+MIN_FONT_SIZE = 7
+
+# Цвет линий таблицы (как у ячеек в изображении карточки)
+GRID_COLOR = '#dee2e6'
+
+
+def blend(color, background, alpha):
+    """Цвет color с прозрачностью alpha поверх background (для Tk, без прозрачности)"""
+    rgb = [alpha * c + (1 - alpha) * b for c, b in zip(to_rgb(color), to_rgb(background))]
+    return to_hex(rgb)
+
+
+class FrameKpi(tk.Frame):
+    """Карточка KPI: значение за день и таблица сравнения с периодами.
+
+    Значения считает KpiEngine (core.kpi) по префиксным суммам дневного куба
+    за миллисекунды, поэтому карточки не кэшируются на диске. Карточка
+    состоит из виджетов Tk: при смене дня меняются только тексты и цвета
+    ячеек, при изменении размера - размеры шрифтов. Цвета отклонений и
+    текст таблицы берутся из core.figures, как у изображения карточки
+    (kpi_card_figure). Изображение строится только для экспорта в PNG
+    (контекстное меню) - в фоновом процессе (core.render). Подклассы
+    задают метрику.
+    """
+
+    METRIC = None
+
+    def __init__(self, parent, style, kpi, renderer, day=None):
+        super().__init__(parent)
+        self.look = KPI_CARDS[self.METRIC]
+        self.configure(borderwidth=2, relief="groove", bg=self.look["facecolor"])
+
+        # Стили для изображения карточки (экспорт)
+        self.STYLE = style
+        self.kpi = kpi
+        self.renderer = renderer
+        # День карточки (None - последний день в данных)
+        self.day = day
+        self.card = None
+
+        # Ячейки таблицы: подписи строк, заголовки столбцов и значения
+        self.row_labels = []
+        self.column_labels = []
+        self.cells = []
+
+        self.frame_size = None
+        self.resize_job = None
+        self.fonts = {name: font.Font(self, family='Segoe UI', size=size,
+                                      weight="normal" if name == "cell" else "bold")
+                      for name, size in FONT_SIZES.items()}
+
+        # Размер фрейма задает сетка вкладки, а не содержимое
+        self.pack_propagate(False)
+        self.create_layout()
+        self.bind("<Configure>", self.on_resize)
+
+        self.menu = tk.Menu(self, tearoff=0)
+        self.menu.add_command(label="Сохранить изображение...", command=self.export_image)
+        self.bind_all_children("<Button-3>", self.show_menu)
+
+        self.create_widgets()
+
+    def create_layout(self):
+        """Значение за день, таблица сравнения и дата"""
+        facecolor = self.look["facecolor"]
+        self.headline = tk.Label(self, font=self.fonts["headline"], justify="left", anchor="w",
+                                 bg=blend(self.look["kpi_color"], facecolor, self.look["kpi_alpha"]),
+                                 padx=10, pady=6)
+        self.headline.pack(side="top", anchor="w", padx=8, pady=(8, 4))
+
+        self.date_label = tk.Label(self, font=self.fonts["date"], bg=facecolor, anchor="e")
+        self.date_label.pack(side="bottom", anchor="e", padx=8, pady=(0, 4))
+
+        # Линии таблицы - фон рамки в промежутках между ячейками
+        self.table = tk.Frame(self, bg=GRID_COLOR, padx=1, pady=1)
+        self.table.pack(side="top", fill="both", expand=True, padx=(8, 8), pady=4)
+
+        self.error_label = tk.Label(self, fg="red", bg=facecolor, wraplength=300)
+
+    def build_table(self, rows, columns):
+        """Создает ячейки таблицы под число строк и столбцов"""
+        for widget in self.table.winfo_children():
+            widget.destroy()
+        header = self.look["header_color"]
+
+        tk.Label(self.table, bg=self.look["facecolor"]).grid(row=0, column=0, sticky="nsew")
+        self.column_labels = [self.table_label(header, "header") for _ in columns]
+        for col, label in enumerate(self.column_labels, start=1):
+            label.grid(row=0, column=col, sticky="nsew", padx=(1, 0))
+        self.row_labels = [self.table_label(header, "cell") for _ in rows]
+        for row, label in enumerate(self.row_labels, start=1):
+            label.grid(row=row, column=0, sticky="nsew", pady=(1, 0))
+
+        self.cells = []
+        for row in range(len(rows)):
+            self.cells.append([self.table_label("white", "cell") for _ in columns])
+            for col, label in enumerate(self.cells[-1], start=1):
+                label.grid(row=row + 1, column=col, sticky="nsew", padx=(1, 0), pady=(1, 0))
+
+        for col in range(len(columns) + 1):
+            self.table.grid_columnconfigure(col, weight=1, uniform="kpi")
+        for row in range(len(rows) + 1):
+            self.table.grid_rowconfigure(row, weight=1, uniform="kpi")
+        self.bind_all_children("<Button-3>", self.show_menu)
+
+    def table_label(self, bg, font_name):
+        return tk.Label(self.table, bg=bg, font=self.fonts[font_name], borderwidth=0)
+
+    def create_widgets(self):
+        try:
+            day = self.day or self.kpi.latest_date
+            self.card = self.kpi.card(self.METRIC, day)
+        except Exception as e:
+            # Если что-то пошло не так, показываем сообщение об ошибке
+            self.show_error(e)
+            return
+        self.show_card(self.card)
+
+    def show_day(self, day):
+        """Показывает карточку за выбранный день"""
+        self.day = day
+        self.create_widgets()
+
+    def show_card(self, card):
+        """Обновляет тексты и цвета виджетов карточки на месте"""
+        rows, columns, cell_text = kpi_table_text(card)
+        colors = kpi_cell_colors(card, cell_text, self.look["delta_colors"])
+        if len(self.row_labels) != len(rows) or len(self.column_labels) != len(columns):
+            self.build_table(rows, columns)
+
+        self.error_label.place_forget()
+        self.headline.configure(text=self.look["headline"].format(value=int(card["today"])))
+        self.date_label.configure(text=f"ДАТА: {card['date'].strftime('%d.%m.%Y')}")
+        for label, text in zip(self.column_labels, columns):
+            label.configure(text=text)
+        for label, text in zip(self.row_labels, rows):
+            label.configure(text=text)
+        for row_cells, row_text, row_colors in zip(self.cells, cell_text, colors):
+            for label, text, color in zip(row_cells, row_text, row_colors):
+                label.configure(text=text, bg=color)
+
+    def show_error(self, error):
+        self.card = None
+        self.error_label.configure(text=f"Ошибка при создании графика: {str(error)}")
+        self.error_label.place(relx=0.5, rely=0.5, anchor="center")
+
+    def on_resize(self, event):
+        """Подбирает шрифты под новый размер, когда он перестал меняться"""
+        if (event.width, event.height) == self.frame_size:
+            return
+        self.frame_size = (event.width, event.height)
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(RESIZE_DELAY_MS, self.scale_fonts)
+
+    def destroy(self):
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+            self.resize_job = None
+        super().destroy()
+
+    def scale_fonts(self):
+        """Размеры шрифтов пропорционально размеру карточки"""
+        self.resize_job = None
+        width, height = self.frame_size
+        scale = min(width / BASE_SIZE[0], height / BASE_SIZE[1])
+        for name, size in FONT_SIZES.items():
+            self.fonts[name].configure(size=max(MIN_FONT_SIZE, round(size * scale)))
+        self.error_label.configure(wraplength=max(100, width - 20))
+
+    def bind_all_children(self, sequence, func):
+        """Привязывает обработчик к фрейму и всем его виджетам"""
+        widgets = [self]
+        while widgets:
+            widget = widgets.pop()
+            widget.bind(sequence, func)
+            widgets.extend(widget.winfo_children())
+
+    def show_menu(self, event):
+        if self.card is not None:
+            self.menu.tk_popup(event.x_root, event.y_root)
+
+    def export_image(self):
+        """Сохраняет изображение карточки (matplotlib) в PNG"""
+        if self.card is None:
+            return
+        file_path = filedialog.asksaveasfilename(parent=self, defaultextension=".png",
+                                                 filetypes=[("PNG", "*.png")],
+                                                 initialfile=f"kpi_{self.METRIC}.png")
+        if not file_path:
+            return
+        width, height = self.STYLE["figsize"]
+        future = self.renderer.submit(kpi_card_figure, (self.card, self.STYLE), (width * 100, height * 100))
+        self.after(RENDER_POLL_MS, self.poll_export, future, file_path)
+
+    def poll_export(self, future, file_path):
+        """Сохраняет изображение, когда фоновый процесс его нарисовал"""
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self.after(RENDER_POLL_MS, self.poll_export, future, file_path)
+            return
+        try:
+            width, height, pixels = future.result()
+            Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1).save(file_path)
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось сохранить изображение: {e}", parent=self)
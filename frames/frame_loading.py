@@ -0,0 +1,59 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+
+
+class FrameLoading(tk.Frame):
+    def __init__(self, parent, file_path, total_bytes, on_cancel):
+        super().__init__(parent)
+        self.configure(borderwidth=2, relief="groove")
+
+        self.total_bytes = max(total_bytes, 1)
+        self.on_cancel = on_cancel
+        self.stage = "Чтение"
+
+        self.create_widgets(file_path)
+
+    def create_widgets(self, file_path):
+        """Метод для создания виджетов фрейма"""
+        container = ttk.Frame(self)
+        container.place(relx=0.5, rely=0.5, anchor="center")
+
+        ttk.Label(container,
+                  text=f"Загрузка файла: {os.path.basename(file_path)}",
+                  font=('Segoe UI', 12, 'bold')).pack(pady=(0, 10))
+
+        self.progress = ttk.Progressbar(container, orient="horizontal", length=500,
+                                        mode="determinate", maximum=self.total_bytes)
+        self.progress.pack(pady=5)
+
+        self.status_label = ttk.Label(container, text="Подготовка...", font=('Segoe UI', 10))
+        self.status_label.pack(pady=5)
+
+        self.cancel_button = ttk.Button(container, text="Отмена", command=self.cancel)
+        self.cancel_button.pack(pady=(10, 0))
+
+    def update_progress(self, bytes_read, rows):
+        """Обновляет полосу прогресса и подпись"""
+        self.progress["value"] = bytes_read
+        percent = bytes_read / self.total_bytes * 100
+        self.status_label.config(
+            text=f"{self.stage}. Прочитано: {bytes_read / 2 ** 20:.1f} из {self.total_bytes / 2 ** 20:.1f} МБ "
+                 f"({percent:.0f}%), строк: {rows:,}".replace(",", " ")
+        )
+
+    def set_stage(self, text):
+        """Задает текущий этап загрузки (чтение CSV, проверка кэша и т.д.)"""
+        self.stage = text
+        self.progress["value"] = 0
+        self.set_status(f"{text}...")
+
+    def set_status(self, text):
+        """Показывает произвольный статус (например, построение дашборда)"""
+        self.status_label.config(text=text)
+
+    def cancel(self):
+        """Обработчик кнопки «Отмена»"""
+        self.cancel_button.state(["disabled"])
+        self.set_status("Отмена загрузки...")
+        self.on_cancel()
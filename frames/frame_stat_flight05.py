@@ -1,44 +1,39 @@
 import tkinter as tk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-
-def apply_common_style(ax, title, xlabel="", ylabel=""):
-    ax.set_title(title, fontsize=14, weight='bold', pad=15)
-    ax.set_xlabel(xlabel, fontsize=12)
-    ax.set_ylabel(ylabel, fontsize=12)
-    ax.tick_params(axis='x', labelsize=10)
-    ax.tick_params(axis='y', labelsize=10)
-    sns.despine()
-    plt.setp(ax.get_xticklabels(), rotation=30, ha="right")
-
-
-def add_value_labels(ax, orient="v"):
-    """Добавляет подписи к столбцам"""
-    for container in ax.containers:
-        if orient == "v":
-            ax.bar_label(container, fmt='%d', label_type='edge', padding=3, fontsize=9)
-        else:
-            ax.bar_label(container, fmt='%d', label_type='edge', padding=3, fontsize=9)
+from core.figures import FLIGHT_CHARTS, bar_at, flight_chart_figure, outline_bar
+from frames.figure_registry import FigureRegistry
 
 
 class FrameStatFlight05(tk.Frame):
-    def __init__(self, parent, df):
+    """Топ авиакомпаний; щелчок по столбцу вызывает on_select("Airline_name", авиакомпания)"""
+
+    def __init__(self, parent, aggregates, figures=None, on_select=None, selected=None):
         super().__init__(parent)
-        self.df = df.copy()
+        self.aggregates = aggregates
+        self.figures = figures or FigureRegistry()
+        self.on_select = on_select
         self.configure(borderwidth=2, relief="ridge")
         self.create_plot()
+        if selected is not None:
+            self.show_selected(selected)
 
     def create_plot(self):
-        fig, ax = plt.subplots(figsize=(6, 4))
-        sns.set_theme(style="whitegrid")
-        cancelled = self.df[self.df["IsCancelled"] == True]["Airline_name"].value_counts().head(10)
-        sns.barplot(y=cancelled.index, x=cancelled.values, palette="pastel", ax=ax)
-        apply_common_style(ax, "Топ-10 авиакомпаний по отменам", "Количество отмен", "Авиакомпания")
-        add_value_labels(ax, orient="h")
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, self)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
\ No newline at end of file
+        fig = self.figures.track(flight_chart_figure("airline_cancelled", self.aggregates), self)
+        self.ax = fig.axes[0]
+        # Авиакомпании в порядке столбцов
+        self.airlines = list(FLIGHT_CHARTS["airline_cancelled"][0](self.aggregates).index)
+
+        self.canvas = FigureCanvasTkAgg(fig, self)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas.mpl_connect("button_press_event", self.on_click)
+
+    def on_click(self, event):
+        airline = bar_at(self.ax, event, self.airlines)
+        if airline is not None and self.on_select is not None:
+            self.on_select("Airline_name", airline)
+
+    def show_selected(self, airline):
+        """Обводит столбец выбранной авиакомпании"""
+        outline_bar(self.ax, self.airlines, airline)
+        self.canvas.draw_idle()
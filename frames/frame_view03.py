@@ -1,40 +1,42 @@
 import tkinter as tk
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import seaborn as sns
-import numpy as np
-from matplotlib import ticker
 from matplotlib.animation import FuncAnimation
+from core.figures import (TOP_ROUTES_STYLE, bar_at, figure_scale, outline_bar, style_top_routes_axes,
+                          top_routes_artists, update_top_routes)
+from core.metrics import top_routes
+from frames.figure_registry import FigureRegistry
+from frames.resize_manager import ResizeManager
 
 
 class FrameOverview03(tk.Frame):
-    def __init__(self, parent, dataframe, style):
+    """Top routes of the day; a click on a bar calls on_select("Airport_arr", route)"""
+
+    def __init__(self, parent, dataset, style, resizer=None, figures=None,
+                 on_select=None, selected=None):
         super().__init__(parent)
-        self.df = dataframe
-        self.style = {
-            "bg_color": "#2E3440",
-            "bar_color": "#88C0D0",
-            "highlight_color": "#BF616A",
-            "text_color": "#E5E9F0",
-            "grid_color": "#4C566A",
-            "title_font": {"family": "sans-serif", "weight": "bold", "size": 14},
-            "label_font": {"family": "sans-serif", "size": 12},
-            "tick_font": {"family": "sans-serif", "size": 10},
-            "annotation_font": {"family": "sans-serif", "size": 9, "weight": "bold"},
-            "palette": "mako"
-        }
+        self.dataset = dataset
+        self.resizer = resizer or ResizeManager(self)
+        self.figures = figures or FigureRegistry()
+        self.style = TOP_ROUTES_STYLE
+        self.on_select = on_select
+        # Animation runs only while the tab is visible
+        self.active = True
         self.create_plot()
+        if selected is not None:
+            self.show_selected(selected)
 
     def create_plot(self):
         # Prepare data
-        latest_date = self.df['Date'].max().date()
+        latest_date = self.dataset.latest_date
         self.today = latest_date
-        today_df = self.df[self.df['Date'].dt.date == latest_date]
-        self.top_routes = today_df.groupby("Airport_arr")["Total_Passengers"].sum().sort_values(ascending=False).head(
-            10)
+        self.top_routes = top_routes(self.dataset, latest_date)
 
         # Create figure with dynamic size
-        self.fig, self.ax = plt.subplots(figsize=(6, 4), facecolor=self.style["bg_color"])  # Smaller initial size
+        self.fig = self.figures.track(Figure(figsize=(6, 4), facecolor=self.style["bg_color"]), self)  # Smaller initial size
+        self.ax = self.fig.subplots()
         self.fig.subplots_adjust(left=0.3, right=0.95, top=0.9, bottom=0.1)
 
         # Setup style
@@ -46,117 +48,78 @@ class FrameOverview03(tk.Frame):
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(expand=True, fill="both", padx=5, pady=5)
 
-        # Bind resize event
-        self.bind("<Configure>", self.on_resize)
+        # Resize events are coalesced by the shared resize manager
+        self.resizer.register(self.canvas, self.on_resize)
+        self.canvas.mpl_connect("button_press_event", self.on_click)
 
         # Create initial plot
         self.setup_plot()
         self.create_animation()
 
     def setup_plot(self):
-        """Setup the initial plot configuration"""
+        """Setup the static plot and pre-allocate bars and value labels"""
         self.ax.clear()
-        self.ax.set_facecolor(self.style["bg_color"])
-        self.ax.grid(True, color=self.style["grid_color"], linestyle='--', alpha=0.7)
-
-        for spine in self.ax.spines.values():
-            spine.set_edgecolor(self.style["grid_color"])
-
-        # Set titles and labels
-        self.ax.set_title(
-            f"ТОП-10 САМЫХ ЗАГРУЖЕННЫХ НАПРАВЛЕНИЙ\n{self.today.strftime('%d %B %Y').upper()}",
-            fontdict={
-                "family": "sans-serif",
-                "weight": "bold",
-                "size": self.scale_font(12),  # Scaled font
-                "color": self.style["text_color"]
-            },
-            pad=self.scale_value(20)
-        )
-
-        self.ax.set_xlabel(
-            "ОБЩЕЕ КОЛИЧЕСТВО ПАССАЖИРОВ",
-            fontdict={
-                "family": "sans-serif",
-                "size": self.scale_font(10),
-                "color": self.style["text_color"]
-            },
-            labelpad=self.scale_value(10)
-        )
+        style_top_routes_axes(self.ax, self.today, self.style, figure_scale(self.fig))
 
-        self.ax.set_ylabel(
-            "АЭРОПОРТ НАЗНАЧЕНИЯ",
-            fontdict={
-                "family": "sans-serif",
-                "size": self.scale_font(10),
-                "color": self.style["text_color"]
-            },
-            labelpad=self.scale_value(10)
-        )
+        # All bars are created once, frames only change their widths and labels
+        self.bars, self.labels = top_routes_artists(self.ax, self.top_routes, self.style, figure_scale(self.fig))
+        self.artists = list(self.bars) + self.labels
 
-        self.ax.tick_params(
-            axis='both',
-            colors=self.style["text_color"],
-            labelsize=self.scale_font(8)
-        )
-        self.ax.xaxis.set_major_formatter(ticker.StrMethodFormatter('{x:,.0f}'))
+        # Keep value labels inside the axes: blitting restores only the axes area
+        if len(self.top_routes):
+            self.ax.set_xlim(0, max(self.top_routes.values) * 1.2)
 
     def create_animation(self):
-        """Create the animation"""
+        """Create the blitted animation (static background is cached by matplotlib)"""
+
+        def init():
+            update_top_routes(self.bars, self.labels, self.top_routes, 0, self.style)
+            return self.artists
 
         def animate(i):
-            y_data = self.top_routes.index[:i + 1]
-            x_data = self.top_routes.values[:i + 1]
-
-            self.ax.clear()
-            self.setup_plot()  # Reapply styling
-
-            bars = self.ax.barh(y_data, x_data, color=self.style["bar_color"], height=0.7)
-
-            # Highlight the top bar
-            if i > 0:
-                bars[-1].set_color(self.style["highlight_color"])
-
-            # Add value labels
-            for bar in bars:
-                width = bar.get_width()
-                self.ax.text(
-                    width + max(self.top_routes.values) * 0.02,
-                    bar.get_y() + bar.get_height() / 2,
-                    f'{width:,.0f}',
-                    ha='left',
-                    va='center',
-                    fontdict={
-                        "family": "sans-serif",
-                        "size": self.scale_font(8),
-                        "weight": "bold",
-                        "color": self.style["text_color"]
-                    }
-                )
-
-            return bars,
+            if not self.active:
+                self.anim.pause()  # A redraw after resize restarted the timer while hidden
+            update_top_routes(self.bars, self.labels, self.top_routes, i + 1, self.style)
+            if i == len(self.top_routes) - 1:
+                # The last frame stays on screen: draw bars in regular redraws again
+                for artist in self.artists:
+                    artist.set_animated(False)
+            return self.artists
 
         self.anim = FuncAnimation(
-            self.fig, animate, frames=len(self.top_routes), interval=500, blit=False, repeat=False
+            self.fig, animate, init_func=init, frames=len(self.top_routes), interval=500, blit=True, repeat=False
         )
 
-    def on_resize(self, event):
-        """Handle window resize event"""
-        if event.width < 10 or event.height < 10:  # Ignore minimal sizes
+    def set_active(self, active):
+        """Pause the animation while the tab is hidden and resume it when shown"""
+        self.active = active
+        if self.anim.event_source is None:
+            return  # Animation has already finished
+        if active:
+            self.anim.resume()
+        else:
+            self.anim.pause()
+
+    def on_click(self, event):
+        route = bar_at(self.ax, event, self.top_routes.index)
+        if route is not None and self.on_select is not None:
+            self.on_select("Airport_arr", route)
+
+    def show_selected(self, route):
+        """Outline the bar of the selected route"""
+        outline_bar(self.ax, self.top_routes.index, route, color=self.style["text_color"])
+        self.canvas.draw_idle()
+
+    def on_resize(self, width, height):
+        """Adjust margins to the new canvas size (the manager redraws afterwards)"""
+        if width < 10 or height < 10:  # Ignore minimal sizes
             return
 
-        # Calculate new figure size (in inches, considering DPI)
-        dpi = self.fig.get_dpi()
-        new_width = event.width / dpi - 1  # Subtract some padding
-        new_height = event.height / dpi - 1
-
-        # Set minimum size
+        # Figure size in inches (the figure already follows the canvas), with minimums
+        new_width, new_height = self.fig.get_size_inches()
         new_width = max(4, new_width)
         new_height = max(3, new_height)
 
-        # Update figure size
-        self.fig.set_size_inches(new_width, new_height)
-
         # Adjust subplot parameters dynamically
         left = 0.35 - (0.05 * (6 / new_width))  # Adjust left margin based on width
         right = 0.95 - (0.1 * (6 / new_width))
@@ -164,15 +127,8 @@ class FrameOverview03(tk.Frame):
 
         self.fig.subplots_adjust(left=left, right=right, top=top, bottom=0.15)
 
-        # Redraw the canvas
-        self.canvas.draw()
-
-    def scale_font(self, base_size):
-        """Scale font size based on figure dimensions"""
-        fig_width, fig_height = self.fig.get_size_inches()
-        return max(6, base_size * min(fig_width / 6, fig_height / 4))
-
-    def scale_value(self, base_value):
-        """Scale padding/margin values based on figure dimensions"""
-        fig_width, fig_height = self.fig.get_size_inches()
-        return base_value * min(fig_width / 6, fig_height / 4)
\ No newline at end of file
+        # Rescale fonts of the static part and of the value labels
+        scale = figure_scale(self.fig)
+        style_top_routes_axes(self.ax, self.today, self.style, scale)
+        for label in self.labels:
+            label.set_fontsize(max(6, 8 * scale))
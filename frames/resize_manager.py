@@ -0,0 +1,106 @@
+import time
+from types import SimpleNamespace
+import numpy as np
+from PIL import Image, ImageTk
+
+# Интервал обработки изменений размера (мс), примерно 30 кадров в секунду
+FRAME_INTERVAL_MS = 33
+
+# Сколько размер должен не меняться, чтобы график перерисовался заново (мс)
+SETTLE_MS = 200
+
+# Тег изображения-превью на холсте графика
+PREVIEW_TAG = "resize_preview"
+
+
+class ResizeManager:
+    """Общая обработка изменения размера графиков matplotlib.
+
+    Заменяет обработчик <Configure> холста FigureCanvasTkAgg: события
+    копятся и разбираются не чаще одного раза за FRAME_INTERVAL_MS для всех
+    графиков сразу. Пока размер меняется (окно тянут за край), на холсте
+    показывается масштабированный снимок последнего кадра. Когда размер
+    перестал меняться и действительно отличается от прежнего, фигура
+    получает новый размер, вызывается on_resize(width, height) графика и
+    выполняется одна полная перерисовка.
+    """
+
+    def __init__(self, master, interval_ms=FRAME_INTERVAL_MS, settle_ms=SETTLE_MS):
+        self.master = master
+        self.interval_ms = interval_ms
+        self.settle_ms = settle_ms
+        self.entries = []
+        self.job = None
+
+    def register(self, canvas, on_resize=None):
+        """Передает менеджеру изменение размера холста canvas (FigureCanvasTkAgg)"""
+        entry = SimpleNamespace(canvas=canvas, on_resize=on_resize, size=None, pending=None,
+                                changed_at=0.0, snapshot=None, preview=None)
+        self.entries.append(entry)
+        widget = canvas.get_tk_widget()
+        widget.bind("<Configure>", lambda event: self.on_configure(entry, event))
+        widget.bind("<Destroy>", lambda event: self.unregister(entry), add="+")
+
+    def unregister(self, entry):
+        if entry in self.entries:
+            self.entries.remove(entry)
+
+    def on_configure(self, entry, event):
+        """Запоминает новый размер; обработка - в flush"""
+        size = (event.width, event.height)
+        if size == entry.size and entry.snapshot is None:
+            entry.pending = None  # Размер вернулся к нарисованному, превью не показано
+            return
+        if size == entry.pending:
+            return
+        entry.pending = size
+        entry.changed_at = time.monotonic()
+        if self.job is None:
+            self.job = self.master.after(self.interval_ms, self.flush)
+
+    def flush(self):
+        """Показывает превью меняющихся графиков и перерисовывает устоявшиеся"""
+        self.job = None
+        now = time.monotonic()
+        waiting = False
+        for entry in list(self.entries):
+            if entry.pending is None:
+                continue
+            if entry.size is not None and (now - entry.changed_at) * 1000 < self.settle_ms:
+                self.show_preview(entry)
+                waiting = True
+            else:
+                self.apply(entry)
+        if waiting:
+            self.job = self.master.after(self.interval_ms, self.flush)
+
+    def show_preview(self, entry):
+        """Масштабированный снимок последнего кадра вместо полной перерисовки"""
+        if entry.snapshot is None:
+            try:
+                entry.snapshot = Image.fromarray(np.array(entry.canvas.buffer_rgba()))
+            except AttributeError:
+                return  # Фигура еще ни разу не рисовалась
+        width, height = entry.pending
+        if width < 1 or height < 1:
+            return
+        image = entry.snapshot.resize((width, height), Image.BILINEAR)
+        widget = entry.canvas.get_tk_widget()
+        entry.preview = ImageTk.PhotoImage(image, master=widget)
+        widget.delete(PREVIEW_TAG)
+        widget.create_image(0, 0, anchor="nw", image=entry.preview, tags=PREVIEW_TAG)
+
+    def apply(self, entry):
+        """Новый размер фигуры и одна перерисовка"""
+        width, height = entry.pending
+        entry.pending = None
+        entry.size = (width, height)
+        entry.snapshot = None
+        entry.preview = None
+        entry.canvas.get_tk_widget().delete(PREVIEW_TAG)
+
+        # Тот же расчет, что и в обработчике FigureCanvasTkAgg (размер фигуры по холсту)
+        entry.canvas.resize(SimpleNamespace(width=width, height=height))
+        if entry.on_resize is not None:
+            entry.on_resize(width, height)
+        entry.canvas.draw_idle()
@@ -1,7 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
+from core.backfill import export_history, kpi_history
+from core.cache import SidecarCache
+from core.loader import CsvLoader
+from core.render import FigureRenderer
+from core.results import ResultCache
 from frames.frame01 import Frame01
+from frames.frame_loading import FrameLoading
+
+
+# Интервал опроса фоновой загрузки (мс)
+LOADER_POLL_MS = 100
+
+# Представления общего набора данных не копируют буферы, а при записи копируют только изменяемую часть
+pd.set_option("mode.copy_on_write", True)
 
 
 class MainApplication(tk.Tk):
@@ -10,8 +23,11 @@ class MainApplication(tk.Tk):
         self.title("Аэропорт 360")
         self.geometry("1500x1000")
 
-        # Переменная для хранения DataFrame
-        self.current_df = None
+        # Общий набор данных только для чтения
+        self.current_dataset = None
+
+        # Дневные агрегаты (единственные данные в потоковом режиме)
+        self.current_aggregates = None
 
         # Создаем меню
         self.create_menu()
@@ -23,6 +39,21 @@ class MainApplication(tk.Tk):
         # Создаем основной фрейм (пока пустой)
         self.frame1 = None
 
+        # Фоновая загрузка файла и фрейм с прогрессом
+        self.loader = None
+        self.loading_frame = None
+        self.loading_initial = False
+
+        # Колоночный кэш открытых файлов
+        self.table_cache = SidecarCache()
+
+        # Кэш показателей, которые считаются по всем строкам файла (профиль колонок, пассажиропоток)
+        self.result_cache = ResultCache()
+
+        # Процессы для отрисовки изображений карточек KPI (экспорт в PNG)
+        # запускаются при первом сохранении
+        self.renderer = FigureRenderer()
+
         # При первом открытии сразу вызываем диалог выбора файла
         self.first_open_file()
 
@@ -33,6 +64,10 @@ class MainApplication(tk.Tk):
         # Меню File
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="Open file", command=self.open_file)
+        file_menu.add_command(label="Open file (streaming)", command=lambda: self.open_file(streaming=True))
+        file_menu.add_separator()
+        file_menu.add_command(label="Export KPI history", command=self.export_kpi_history)
+        file_menu.add_command(label="Figures in memory", command=self.show_figure_stats)
         file_menu.add_separator()
         file_menu.add_command(label="Close file", command=self.close_file)
         menubar.add_cascade(label="File", menu=file_menu)
@@ -43,7 +78,7 @@ class MainApplication(tk.Tk):
         """Обработчик первого открытия файла при запуске"""
         self.open_file(initial=True)
 
-    def open_file(self, initial=False):
+    def open_file(self, initial=False, streaming=False):
         """Обработчик открытия файла"""
         file_path = filedialog.askopenfilename(
             title="Выберите файл",
@@ -61,31 +96,145 @@ class MainApplication(tk.Tk):
                     self.destroy()  # Закрываем приложение
             return
 
+        # Прерываем предыдущую загрузку, если она ещё идёт
+        self.cancel_loading(reopen=False)
+
+        try:
+            self.loader = CsvLoader(file_path, cache=self.table_cache, streaming=streaming)
+        except OSError as e:
+            messagebox.showerror("Ошибка", f"Не удалось загрузить файл: {str(e)}")
+            if initial:
+                self.open_file(initial=True)
+            return
+
+        self.loading_initial = initial
+
+        # Показываем прогресс поверх текущего фрейма
+        self.loading_frame = FrameLoading(self, file_path, self.loader.total_bytes, self.cancel_loading)
+        self.loading_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        self.loading_frame.tkraise()
+
+        self.loader.start()
+        self.after(LOADER_POLL_MS, self.poll_loader, self.loader)
+
+    def poll_loader(self, loader):
+        """Забирает события фоновой загрузки в главном потоке Tk"""
+        if loader is not self.loader:
+            return  # Загрузка была отменена или заменена новой
+
+        while not loader.events.empty():
+            kind, payload = loader.events.get_nowait()
+
+            if kind == "stage":
+                self.loading_frame.set_stage(payload)
+            elif kind == "progress":
+                self.loading_frame.update_progress(*payload)
+            elif kind == "done":
+                self.finish_loading(payload, loader)
+                return
+            elif kind == "cancelled":
+                self.hide_loading()
+                return
+            elif kind == "error":
+                self.hide_loading()
+                messagebox.showerror("Ошибка", f"Не удалось загрузить файл: {str(payload)}")
+                if self.loading_initial:
+                    self.open_file(initial=True)  # Повторяем попытку для первого открытия
+                return
+
+        self.after(LOADER_POLL_MS, self.poll_loader, loader)
+
+    def finish_loading(self, result, loader):
+        """Передает загруженные данные в интерфейс"""
+        initial = self.loading_initial
+        self.loading_frame.set_status("Построение дашборда...")
+        self.update_idletasks()
+
         try:
-            # Читаем CSV файл
-            self.current_df = pd.read_csv(file_path, parse_dates=["Date"])
+            # В потоковом режиме набора данных нет, есть только агрегаты
+            self.current_dataset, self.current_aggregates = result
 
             # Уничтожаем старый фрейм, если он есть
             if self.frame1 is not None:
                 self.frame1.destroy()
 
-            # Создаем новый фрейм с передачей DataFrame
-            self.frame1 = Frame01(self, self.current_df)
+            # Создаем новый фрейм с передачей набора данных и агрегатов
+            results = self.result_cache.bind(loader.file_path, loader.fingerprint)
+            self.frame1 = Frame01(self, self.current_dataset, self.current_aggregates, results, self.renderer)
             self.frame1.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
 
         except Exception as e:
             messagebox.showerror("Ошибка", f"Не удалось загрузить файл: {str(e)}")
             if initial:
+                self.hide_loading()
                 self.open_file(initial=True)  # Повторяем попытку для первого открытия
+                return
+
+        self.hide_loading()
+
+    def cancel_loading(self, reopen=True):
+        """Отменяет текущую фоновую загрузку"""
+        if self.loader is None:
+            return
+        self.loader.cancel()
+        self.hide_loading()
+
+        # При первом запуске без данных снова предлагаем выбрать файл
+        if reopen and self.loading_initial and self.frame1 is None:
+            self.after_idle(self.open_file, True)
+
+    def hide_loading(self):
+        """Убирает фрейм с прогрессом"""
+        self.loader = None
+        if self.loading_frame is not None:
+            self.loading_frame.destroy()
+            self.loading_frame = None
 
     def close_file(self):
         """Обработчик закрытия файла"""
+        self.cancel_loading(reopen=False)
         if self.frame1 is not None:
             self.frame1.destroy()
             self.frame1 = None
-        self.current_df = None
+        self.current_dataset = None
+        self.current_aggregates = None
+        self.result_cache.flush()
         print("Файл закрыт, данные очищены")
 
+    def destroy(self):
+        """Сохраняет отметки использования записей кэшей при закрытии окна"""
+        self.result_cache.flush()
+        self.table_cache.flush()
+        super().destroy()
+
+    def show_figure_stats(self):
+        """Показывает число живых фигур и примерный объем их памяти"""
+        if self.frame1 is None:
+            messagebox.showinfo("Графики", "Файл не открыт")
+            return
+        messagebox.showinfo("Графики", self.frame1.figures.describe())
+
+    def export_kpi_history(self):
+        """Сохраняет карточки KPI за каждый день открытого файла"""
+        if self.frame1 is None:
+            messagebox.showwarning("Экспорт", "Сначала откройте файл")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            title="Сохранить историю KPI",
+            defaultextension=".parquet",
+            filetypes=(("Parquet files", "*.parquet"), ("CSV files", "*.csv"))
+        )
+        if not file_path:
+            return
+
+        try:
+            export_history(kpi_history(self.frame1.kpi), file_path)
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось сохранить файл: {str(e)}")
+            return
+        messagebox.showinfo("Экспорт", f"История KPI сохранена в {file_path}")
+
 
 if __name__ == "__main__":
     app = MainApplication()
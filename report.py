@@ -0,0 +1,155 @@
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+import matplotlib
+
+# Отчет строится без окна: графики рисуются в память (Agg), tkinter не импортируется
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+from core.backfill import kpi_history
+from core.cache import SidecarCache
+from core.figures import (FLIGHT_CHARTS, delay_reasons_figure, flight_chart_figure, hourly_profile_figure,
+                          kpi_card_figure, monthly_passengers_figure, top_routes_figure, weekly_profile_figure)
+from core.kpi import KpiEngine
+from core.loader import CsvLoader
+from core.metrics import delay_reasons, hourly_profile, monthly_passengers, top_routes, weekly_profile
+from core.results import DatasetResults, ResultCache
+
+
+pd.set_option("mode.copy_on_write", True)
+
+# Фон круговой диаграммы причин задержек (как GRAPH_STYLE["facecolor"] в дашборде)
+OVERVIEW_FACECOLOR = "#f8f9fa"
+
+
+def parse_day(text):
+    """Дата из строки ДД.ММ.ГГГГ или ГГГГ-ММ-ДД"""
+    for date_format in ("%d.%m.%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"Неверная дата: {text} (ожидается ДД.ММ.ГГГГ)")
+
+
+def to_json(value):
+    """Приводит результаты (pandas, numpy, даты) к типам JSON"""
+    if isinstance(value, dict):
+        return {str(key): to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    if isinstance(value, pd.DataFrame):
+        return to_json(value.to_dict(orient="records"))
+    if isinstance(value, pd.Series):
+        return to_json(value.to_dict())
+    if isinstance(value, (date, pd.Timestamp)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def collect_metrics(dataset, aggregates, kpi, day, results=None):
+    """Все показатели дашборда за день (в потоковом режиме - только по агрегатам)"""
+    results = results or DatasetResults()
+    metrics = {
+        "date": day,
+        "kpi": kpi.cards(day),
+        "hourly_profile": hourly_profile(aggregates, day),
+        "delay_reasons": delay_reasons(aggregates, day),
+        "flights": {name: chart[0](aggregates) for name, chart in FLIGHT_CHARTS.items()},
+    }
+    if dataset is not None:
+        metrics["top_routes"] = top_routes(dataset, day)
+        metrics["monthly_passengers"] = results.get(monthly_passengers, dataset)
+        metrics["weekly_profile"] = results.get(weekly_profile, dataset)
+    return metrics
+
+
+def write_tables(metrics, kpi, output_dir):
+    """Сохраняет показатели в metrics.json и таблицы CSV"""
+    with open(os.path.join(output_dir, "metrics.json"), "w", encoding="utf-8") as f:
+        json.dump(to_json(metrics), f, ensure_ascii=False, indent=1)
+
+    day = metrics["date"]
+    tables = {
+        "kpi": kpi_history(kpi, day, day),
+        "hourly_profile": metrics["hourly_profile"]["hourly"],
+        "delay_reasons": metrics["delay_reasons"].rename("Flights").rename_axis("DelayGroup").reset_index(),
+    }
+    for name, counts in metrics["flights"].items():
+        tables[f"flights_{name}"] = counts.rename("Flights").reset_index()
+    if "top_routes" in metrics:
+        tables["top_routes"] = metrics["top_routes"].reset_index()
+        tables["monthly_passengers"] = metrics["monthly_passengers"]
+        tables["weekly_heatmap"] = metrics["weekly_profile"]["heat"].reset_index()
+
+    for name, table in tables.items():
+        table.to_csv(os.path.join(output_dir, f"{name}.csv"), index=False)
+
+
+def write_figures(metrics, aggregates, output_dir):
+    """Сохраняет графики дашборда в PNG"""
+    day = metrics["date"]
+    figures = {f"kpi_{metric}": lambda card=card: kpi_card_figure(card)
+               for metric, card in metrics["kpi"].items()}
+    figures["hourly_profile"] = lambda: hourly_profile_figure(metrics["hourly_profile"])
+    figures["delay_reasons"] = lambda: delay_reasons_figure(metrics["delay_reasons"], day, OVERVIEW_FACECOLOR)
+    for name in FLIGHT_CHARTS:
+        figures[f"flights_{name}"] = lambda name=name: flight_chart_figure(name, aggregates)
+    if "top_routes" in metrics:
+        years = sorted(metrics["monthly_passengers"]["Year"].unique())
+        figures["top_routes"] = lambda: top_routes_figure(metrics["top_routes"], day)
+        figures["monthly_passengers"] = lambda: monthly_passengers_figure(
+            metrics["monthly_passengers"], years, years[-1])
+        figures["weekly_profile"] = lambda: weekly_profile_figure(metrics["weekly_profile"])
+
+    for name, build in figures.items():
+        fig = build()
+        fig.savefig(os.path.join(output_dir, f"{name}.png"))
+        fig.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Отчет по показателям дашборда без графического интерфейса")
+    parser.add_argument("file", help="CSV файл с данными о рейсах")
+    parser.add_argument("-o", "--output", default="report", help="каталог для результатов (по умолчанию report)")
+    parser.add_argument("-d", "--date", type=parse_day, help="день отчета (по умолчанию последний день в данных)")
+    parser.add_argument("--png", action="store_true", help="сохранить графики в PNG")
+    parser.add_argument("--streaming", action="store_true",
+                        help="потоковый режим: только показатели по дневным агрегатам")
+    parser.add_argument("--no-cache", action="store_true", help="не использовать колоночный кэш и кэш результатов")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    cache = None if args.no_cache else SidecarCache()
+    try:
+        loader = CsvLoader(args.file, cache=cache, streaming=args.streaming)
+        dataset, aggregates = loader.load_with_aggregates()
+    except Exception as e:
+        # Как в дашборде: сообщение вместо трассировки, код возврата 1
+        sys.exit(f"Не удалось загрузить файл: {e}")
+    results = DatasetResults() if args.no_cache else ResultCache().bind(args.file, loader.fingerprint)
+    kpi = KpiEngine(aggregates)
+    day = args.date or kpi.latest_date
+    print(f"Файл загружен за {time.perf_counter() - started:.1f} с")
+
+    os.makedirs(args.output, exist_ok=True)
+    metrics = collect_metrics(dataset, aggregates, kpi, day, results)
+    write_tables(metrics, kpi, args.output)
+    if args.png:
+        write_figures(metrics, aggregates, args.output)
+
+    print(f"Отчет за {day.strftime('%d.%m.%Y')} сохранен в {args.output} "
+          f"за {time.perf_counter() - started:.1f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import json
+import report
+
+COLUMNS = "Date,Hour,DayOfWeek,Year,TimeOfDay,Airline_name,Airport_arr,DelayCategory,DelayGroup," \
+          "IsCancelled,Total_Passengers,Total_Cargo"
+
+# Первый день с задержками, второй - без задержанных рейсов
+ROWS = [
+    "2022-01-01,8,5,2022,Утро,Авиакомпания 1,Аэропорт 1,Малая,Погода,False,120,1500.0",
+    "2022-01-01,14,5,2022,День,Авиакомпания 2,Аэропорт 2,Нет,Не указана,False,90,800.0",
+    "2022-01-02,9,6,2022,Утро,Авиакомпания 1,Аэропорт 2,Нет,Не указана,False,110,1200.0",
+    "2022-01-02,19,6,2022,Вечер,Авиакомпания 2,Аэропорт 1,Нет,Не указана,True,0,0.0",
+]
+
+
+def test_report_on_day_without_delays(tmp_path):
+    """Отчет с графиками за день без задержек строится (вместо круговой диаграммы - заглушка)"""
+    csv_path = tmp_path / "flights.csv"
+    csv_path.write_text("\n".join([COLUMNS] + ROWS) + "\n", encoding="utf-8")
+    output = tmp_path / "report"
+
+    report.main([str(csv_path), "-o", str(output), "-d", "02.01.2022", "--png", "--no-cache"])
+
+    with open(output / "metrics.json", encoding="utf-8") as f:
+        metrics = json.load(f)
+    assert metrics["date"] == "2022-01-02"
+    assert metrics["delay_reasons"] == {}
+    assert (output / "delay_reasons.png").stat().st_size > 0